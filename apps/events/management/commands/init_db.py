@@ -0,0 +1,591 @@
+"""
+Comando para inicializar la base de datos con datos de prueba
+Ejecutar: python manage.py init_db
+"""
+
+import operator
+from collections import namedtuple
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.text import slugify
+from apps.events.models import Category, Venue, Event
+from apps.tickets.models import TicketType, DiscountCode
+from apps.sponsors.models import SponsorTier, Sponsor, Sponsorship
+from apps.sponsors.signals import SPONSOR_TIER_CACHE, FEATURED_SPONSORS_CACHE_KEY
+from apps.tickets.signals import TICKET_TYPE_CACHE
+from config.utils.cache_utils import bump_cache_version
+
+# Importes del seed (se parsean una sola vez)
+PRICE_VIP = Decimal('250000.00')
+PRICE_GENERAL = Decimal('120000.00')
+EARLYBIRD_PERCENTAGE = Decimal('20.00')
+CONTRIBUTION_PLATINUM = Decimal('50000000.00')
+CONTRIBUTION_GOLD = Decimal('30000000.00')
+CONTRIBUTION_SILVER = Decimal('15000000.00')
+CONTRIBUTION_BRONZE = Decimal('5000000.00')
+
+TIER_CONTRIBUTIONS = {
+    'Platinum': CONTRIBUTION_PLATINUM,
+    'Gold': CONTRIBUTION_GOLD,
+    'Silver': CONTRIBUTION_SILVER,
+    'Bronze': CONTRIBUTION_BRONZE,
+}
+# Pago inicial de cada patrocinio (50 % de la contribución del tier),
+# calculado una vez por tier en lugar de multiplicar en cada fila
+PAID_BY_TIER = {
+    name: contribution * Decimal('0.5')
+    for name, contribution in TIER_CONTRIBUTIONS.items()
+}
+
+DAY = timedelta(days=1)
+HOUR = timedelta(hours=1)
+
+# IDs de categorías y lugares del seed, en el mismo orden que sus datos
+CategoryIds = namedtuple('CategoryIds', 'musica tecnologia deportes arte negocios educacion')
+VenueIds = namedtuple('VenueIds', 'convenciones teatro_colon movistar_arena auditorio_unal')
+
+# Columnas de las filas de eventos del seed (tuplas en lugar de dicts)
+EVENT_FIELDS = (
+    'title', 'description', 'short_description', 'category_id', 'venue_id',
+    'organizer_id', 'start_date', 'end_date', 'registration_end', 'is_free',
+    'max_attendees', 'is_featured', 'tags',
+)
+
+
+def create_missing(model, objs, *fields, update_fields=None):
+    """
+    Inserta en un solo bulk_create los objetos cuya clave (fields) aún no
+    existe en la base de datos y devuelve los que se crearon
+    
+    Con update_fields (solo si fields es una clave única) se hace un upsert:
+    el mismo INSERT actualiza esas columnas en las filas existentes, así que
+    volver a ejecutar el script refresca los datos del seed.
+    
+    bulk_create no llama a save(): los slugs se asignan al construir los objetos.
+    """
+    key = operator.attrgetter(*fields)
+    lookup = {f'{fields[0]}__in': {getattr(obj, fields[0]) for obj in objs}}
+    existing = model.objects.filter(**lookup)
+    if len(fields) == 1:
+        existing = set(existing.values_list(fields[0], flat=True))
+    else:
+        existing = set(existing.values_list(*fields))
+    
+    new_objs = [obj for obj in objs if key(obj) not in existing]
+    if update_fields:
+        # MySQL (ON DUPLICATE KEY UPDATE) no admite indicar unique_fields
+        unique_fields = fields if connection.features.supports_update_conflicts_with_target else None
+        model.objects.bulk_create(
+            objs,
+            batch_size=500,
+            update_conflicts=True,
+            update_fields=update_fields,
+            unique_fields=unique_fields
+        )
+    else:
+        model.objects.bulk_create(new_objs, batch_size=500)
+    return new_objs
+
+
+class Command(BaseCommand):
+    help = 'Crea los datos de prueba (usuarios, eventos, tickets y patrocinadores)'
+    
+    def report(self, label, names):
+        """Una sola línea por sección con lo que se creó"""
+        if names:
+            self.stdout.write(f"✅ {label.capitalize()} ({len(names)}): {', '.join(names)}")
+        else:
+            self.stdout.write(f"   {label.capitalize()}: ya existían")
+    
+    def invalidate_caches(self):
+        """Invalida las respuestas cacheadas que dependen de los datos del seed"""
+        bump_cache_version(TICKET_TYPE_CACHE)
+        bump_cache_version(SPONSOR_TIER_CACHE)
+        cache.delete(FEATURED_SPONSORS_CACHE_KEY)
+    
+    def handle(self, *args, **options):
+        self.stdout.write("🚀 Iniciando creación de datos de prueba...")
+        
+        # Todo el seed en una sola transacción: un único commit y, si algo falla,
+        # no quedan datos a medias
+        with transaction.atomic():
+            # bulk_create no emite post_save: en lugar de una invalidación por
+            # fila, las cachés de la API se invalidan una vez tras el commit
+            transaction.on_commit(self.invalidate_caches)
+            
+            # ============= USUARIOS =============
+            self.stdout.write("\n👤 Creando usuarios...")
+        
+            users_data = [
+                {
+                    'username': 'admin',
+                    'email': 'admin@eventhub.com',
+                    'password': 'admin123',
+                    'is_staff': True,
+                    'is_superuser': True,
+                    'first_name': 'Admin',
+                    'last_name': 'EventHub'
+                },
+                {
+                    'username': 'sarah',
+                    'email': 'sarah@eventhub.com',
+                    'password': 'sarah123',
+                    'first_name': 'Sarah',
+                    'last_name': 'García'
+                },
+                {
+                    'username': 'karen',
+                    'email': 'karen@eventhub.com',
+                    'password': 'karen123',
+                    'first_name': 'Karen',
+                    'last_name': 'Rodríguez'
+                },
+                {
+                    'username': 'neyireth',
+                    'email': 'neyireth@eventhub.com',
+                    'password': 'neyireth123',
+                    'first_name': 'Neyireth',
+                    'last_name': 'López'
+                },
+                {
+                    'username': 'aslhy',  # Líder
+                    'email': 'aslhy@eventhub.com',
+                    'password': 'aslhy123',
+                    'first_name': 'Aslhy',
+                    'last_name': 'Martínez',
+                    'is_staff': True
+                },
+            ]
+        
+            # Un solo SELECT para saber cuáles existen y un solo INSERT para el resto;
+            # la contraseña va ya hasheada, sin el UPDATE posterior de set_password()
+            existing_usernames = set(
+                User.objects.filter(
+                    username__in=[data['username'] for data in users_data]
+                ).values_list('username', flat=True)
+            )
+            new_users = [
+                User(**{**data, 'password': make_password(data['password'])})
+                for data in users_data
+                if data['username'] not in existing_usernames
+            ]
+            User.objects.bulk_create(new_users, ignore_conflicts=True)
+            self.report('usuarios', [user.username for user in new_users])
+        
+            # Solo hacen falta los IDs para las claves foráneas
+            user_ids = dict(
+                User.objects.filter(
+                    username__in=[data['username'] for data in users_data]
+                ).values_list('username', 'pk')
+            )
+        
+            # ============= CATEGORÍAS =============
+            self.stdout.write("\n📂 Creando categorías...")
+        
+            categories_data = [
+                {'name': 'Música', 'icon': 'fa-music', 'description': 'Conciertos y festivales musicales'},
+                {'name': 'Tecnología', 'icon': 'fa-laptop', 'description': 'Conferencias y eventos tech'},
+                {'name': 'Deportes', 'icon': 'fa-futbol', 'description': 'Eventos deportivos'},
+                {'name': 'Arte y Cultura', 'icon': 'fa-palette', 'description': 'Exposiciones y eventos culturales'},
+                {'name': 'Negocios', 'icon': 'fa-briefcase', 'description': 'Conferencias empresariales'},
+                {'name': 'Educación', 'icon': 'fa-graduation-cap', 'description': 'Talleres y seminarios'},
+            ]
+        
+            new_categories = create_missing(Category, [
+                Category(**cat_data, slug=slugify(cat_data['name']), is_active=True)
+                for cat_data in categories_data
+            ], 'name', update_fields=['icon', 'description', 'is_active'])
+            self.report('categorías', [category.name for category in new_categories])
+        
+            category_ids = dict(
+                Category.objects.filter(
+                    name__in=[c['name'] for c in categories_data]
+                ).values_list('name', 'pk')
+            )
+            cats = CategoryIds(*(category_ids[c['name']] for c in categories_data))
+        
+            # ============= LUGARES =============
+            self.stdout.write("\n📍 Creando lugares...")
+        
+            venues_data = [
+                {
+                    'name': 'Centro de Convenciones Gonzalo Jiménez de Quesada',
+                    'address': 'Carrera 7 #32-16',
+                    'city': 'Bogotá',
+                    'state': 'Cundinamarca',
+                    'capacity': 2000,
+                    'facilities': 'WiFi, Parking, Aire acondicionado, Catering'
+                },
+                {
+                    'name': 'Teatro Colón',
+                    'address': 'Calle 10 #5-32',
+                    'city': 'Bogotá',
+                    'state': 'Cundinamarca',
+                    'capacity': 800,
+                    'facilities': 'Sistema de sonido profesional, Iluminación, Camerinos'
+                },
+                {
+                    'name': 'Movistar Arena',
+                    'address': 'Carrera 68 #51-23',
+                    'city': 'Bogotá',
+                    'state': 'Cundinamarca',
+                    'capacity': 15000,
+                    'facilities': 'Pantallas gigantes, Parking, Seguridad, Food court'
+                },
+                {
+                    'name': 'Auditorio Universidad Nacional',
+                    'address': 'Carrera 45 #26-85',
+                    'city': 'Bogotá',
+                    'state': 'Cundinamarca',
+                    'capacity': 500,
+                    'facilities': 'Proyector, WiFi, Aire acondicionado'
+                },
+            ]
+        
+            new_venues = create_missing(Venue, [Venue(**venue_data) for venue_data in venues_data], 'name')
+            self.report('lugares', [venue.name for venue in new_venues])
+        
+            venue_ids = dict(
+                Venue.objects.filter(
+                    name__in=[v['name'] for v in venues_data]
+                ).values_list('name', 'pk')
+            )
+            venue_pks = VenueIds(*(venue_ids[v['name']] for v in venues_data))
+        
+            # ============= EVENTOS =============
+            self.stdout.write("\n🎉 Creando eventos...")
+        
+            # Un único instante de referencia y las fechas derivadas, calculadas una vez
+            now = timezone.now()
+            in_15_days = now + 15 * DAY
+            in_30_days = now + 30 * DAY
+            in_40_days = now + 40 * DAY
+            in_45_days = now + 45 * DAY
+            in_47_days = now + 47 * DAY
+            in_59_days = now + 59 * DAY
+            in_60_days = now + 60 * DAY
+            in_80_days = now + 80 * DAY
+            in_90_days = now + 90 * DAY
+        
+            # Filas en el orden de EVENT_FIELDS; todos publicados con registro abierto desde ya
+            events_rows = [
+                (
+                    'Festival de Rock Bogotá 2025',
+                    'El festival de rock más grande de Colombia con bandas nacionales e internacionales.',
+                    'Festival de rock con las mejores bandas',
+                    cats.musica,
+                    venue_pks.movistar_arena,
+                    user_ids['sarah'],
+                    in_60_days,
+                    in_60_days + 8 * HOUR,
+                    in_59_days,
+                    False,
+                    10000,
+                    True,
+                    'rock, música, festival, concierto',
+                ),
+                (
+                    'TechSummit Colombia 2025',
+                    'Conferencia de tecnología con expertos internacionales en IA, Cloud y Desarrollo.',
+                    'La mayor conferencia tech del país',
+                    cats.tecnologia,
+                    venue_pks.convenciones,
+                    user_ids['karen'],
+                    in_45_days,
+                    in_47_days,
+                    in_40_days,
+                    False,
+                    1500,
+                    True,
+                    'tecnología, IA, desarrollo, conferencia',
+                ),
+                (
+                    'Maratón Internacional Bogotá',
+                    '42K por las calles de Bogotá con corredores de todo el mundo.',
+                    'Maratón internacional 42K',
+                    cats.deportes,
+                    venue_pks.movistar_arena,
+                    user_ids['neyireth'],
+                    in_90_days,
+                    in_90_days + 6 * HOUR,
+                    in_80_days,
+                    False,
+                    5000,
+                    False,
+                    'deportes, maratón, running, 42k',
+                ),
+                (
+                    'Exposición: Arte Contemporáneo Latinoamericano',
+                    'Muestra de arte contemporáneo con artistas de toda América Latina.',
+                    'Exposición de arte latinoamericano',
+                    cats.arte,
+                    venue_pks.teatro_colon,
+                    user_ids['aslhy'],
+                    in_30_days,
+                    in_60_days,
+                    in_59_days,
+                    True,
+                    500,
+                    False,
+                    'arte, cultura, exposición, latinoamérica',
+                ),
+            ]
+            titles = [row[0] for row in events_rows]
+        
+            new_events = create_missing(Event, [
+                Event(
+                    **dict(zip(EVENT_FIELDS, row)),
+                    slug=slugify(row[0]),
+                    registration_start=now,
+                    status='published',
+                    is_published=True
+                )
+                for row in events_rows
+            ], 'title')
+            self.report('eventos', [event.title for event in new_events])
+        
+            # MySQL no devuelve los PKs de bulk_create: se releen en una consulta
+            # Solo las columnas que usan los tipos de ticket, códigos y patrocinios
+            events_by_title = {
+                event['title']: event
+                for event in Event.objects.filter(title__in=titles).values(
+                    'id', 'title', 'is_free', 'registration_start', 'registration_end'
+                )
+            }
+            events = [events_by_title[title] for title in titles]
+            event_titles = {event['id']: event['title'] for event in events}
+        
+            # ============= TIPOS DE TICKETS =============
+            self.stdout.write("\n🎫 Creando tipos de tickets...")
+        
+            ticket_types = []
+            for event in events:
+                if not event['is_free']:
+                    # VIP
+                    ticket_types.append(TicketType(
+                        event_id=event['id'],
+                        name='VIP',
+                        description='Acceso VIP con beneficios exclusivos',
+                        price=PRICE_VIP,
+                        quantity_available=100,
+                        quantity_sold=0,
+                        max_per_order=4,
+                        sale_start=event['registration_start'],
+                        sale_end=event['registration_end'],
+                        includes_food=True,
+                        includes_drink=True,
+                        includes_parking=True,
+                        display_order=1
+                    ))
+        
+                    # General
+                    ticket_types.append(TicketType(
+                        event_id=event['id'],
+                        name='General',
+                        description='Entrada general al evento',
+                        price=PRICE_GENERAL,
+                        quantity_available=500,
+                        quantity_sold=0,
+                        max_per_order=6,
+                        sale_start=event['registration_start'],
+                        sale_end=event['registration_end'],
+                        includes_food=False,
+                        includes_drink=True,
+                        includes_parking=False,
+                        display_order=2
+                    ))
+        
+            # Todos los tipos de todos los eventos en un único INSERT
+            new_ticket_types = create_missing(TicketType, ticket_types, 'event_id', 'name')
+            self.report('tipos de ticket', [
+                f"{ticket_type.name} ({event_titles[ticket_type.event_id]})"
+                for ticket_type in new_ticket_types
+            ])
+        
+            # ============= CÓDIGOS DE DESCUENTO =============
+            self.stdout.write("\n💰 Creando códigos de descuento...")
+        
+            discount_codes = [
+                DiscountCode(
+                    code=f'EARLYBIRD{event["id"]}',
+                    description='Descuento por compra anticipada',
+                    discount_type='percentage',
+                    discount_value=EARLYBIRD_PERCENTAGE,
+                    event_id=event['id'],
+                    max_uses=100,
+                    times_used=0,
+                    valid_from=now,
+                    valid_until=in_15_days,
+                    is_active=True
+                )
+                for event in events[:2]  # Solo para los primeros 2 eventos
+            ]
+            new_discount_codes = create_missing(DiscountCode, discount_codes, 'code', update_fields=[
+                'description', 'discount_type', 'discount_value', 'max_uses',
+                'valid_from', 'valid_until', 'is_active'
+            ])
+            self.report('códigos', [discount_code.code for discount_code in new_discount_codes])
+        
+            # ============= SPONSOR TIERS =============
+            self.stdout.write("\n🏆 Creando niveles de patrocinio...")
+        
+            tiers_data = [
+                {
+                    'name': 'Platinum',
+                    'min_contribution': CONTRIBUTION_PLATINUM,
+                    'benefits': 'Logo gigante\nStand premium\n10 tickets VIP\nMención en todos los materiales',
+                    'priority_level': 100,
+                    'logo_size': 'xlarge',
+                    'homepage_featured': True,
+                    'speaking_opportunity': True,
+                    'booth_space': True,
+                    'complimentary_tickets': 10,
+                    'vip_tickets': 10,
+                    'color': '#E5E4E2'
+                },
+                {
+                    'name': 'Gold',
+                    'min_contribution': CONTRIBUTION_GOLD,
+                    'benefits': 'Logo grande\nStand estándar\n6 tickets VIP\nMención en redes sociales',
+                    'priority_level': 80,
+                    'logo_size': 'large',
+                    'homepage_featured': True,
+                    'speaking_opportunity': True,
+                    'booth_space': True,
+                    'complimentary_tickets': 6,
+                    'vip_tickets': 6,
+                    'color': '#FFD700'
+                },
+                {
+                    'name': 'Silver',
+                    'min_contribution': CONTRIBUTION_SILVER,
+                    'benefits': 'Logo mediano\n4 tickets general\nMención en programa',
+                    'priority_level': 60,
+                    'logo_size': 'medium',
+                    'homepage_featured': False,
+                    'speaking_opportunity': False,
+                    'booth_space': True,
+                    'complimentary_tickets': 4,
+                    'vip_tickets': 0,
+                    'color': '#C0C0C0'
+                },
+                {
+                    'name': 'Bronze',
+                    'min_contribution': CONTRIBUTION_BRONZE,
+                    'benefits': 'Logo pequeño\n2 tickets general',
+                    'priority_level': 40,
+                    'logo_size': 'small',
+                    'homepage_featured': False,
+                    'speaking_opportunity': False,
+                    'booth_space': False,
+                    'complimentary_tickets': 2,
+                    'vip_tickets': 0,
+                    'color': '#CD7F32'
+                },
+            ]
+        
+            new_tiers = create_missing(
+                SponsorTier,
+                [SponsorTier(**tier_data) for tier_data in tiers_data],
+                'name',
+                update_fields=[field for field in tiers_data[0] if field != 'name']
+            )
+            self.report('tiers', [tier.name for tier in new_tiers])
+        
+            tiers = SponsorTier.objects.in_bulk([t['name'] for t in tiers_data], field_name='name')
+        
+            # ============= SPONSORS =============
+            self.stdout.write("\n🤝 Creando patrocinadores...")
+        
+            sponsors_data = [
+                {
+                    'name': 'TechCorp Colombia',
+                    'description': 'Líder en soluciones tecnológicas empresariales',
+                    'industry': 'Tecnología',
+                    'contact_person': 'Juan Pérez',
+                    'contact_email': 'juan@techcorp.com',
+                    'contact_phone': '+573001234567',
+                    'website': 'https://techcorp.com',
+                    'tier': tiers['Gold'],
+                    'status': 'active'
+                },
+                {
+                    'name': 'Banco Nacional',
+                    'description': 'Entidad financiera líder en Colombia',
+                    'industry': 'Finanzas',
+                    'contact_person': 'María González',
+                    'contact_email': 'maria@banconacional.com',
+                    'contact_phone': '+573007654321',
+                    'website': 'https://banconacional.com',
+                    'tier': tiers['Platinum'],
+                    'status': 'active'
+                },
+                {
+                    'name': 'Café Premium',
+                    'description': 'Productores de café colombiano de exportación',
+                    'industry': 'Alimentos y Bebidas',
+                    'contact_person': 'Carlos Ramírez',
+                    'contact_email': 'carlos@cafepremium.com',
+                    'contact_phone': '+573009876543',
+                    'website': 'https://cafepremium.com',
+                    'tier': tiers['Silver'],
+                    'status': 'active'
+                },
+            ]
+        
+            new_sponsors = create_missing(Sponsor, [
+                Sponsor(**sponsor_data, slug=slugify(sponsor_data['name']))
+                for sponsor_data in sponsors_data
+            ], 'name')
+            self.report('sponsors', [sponsor.name for sponsor in new_sponsors])
+        
+            sponsors_by_name = {
+                sponsor.name: sponsor
+                for sponsor in Sponsor.objects.filter(
+                    name__in=[s['name'] for s in sponsors_data]
+                ).select_related('tier')
+            }
+            sponsors = [sponsors_by_name[sponsor_data['name']] for sponsor_data in sponsors_data]
+        
+            # ============= SPONSORSHIPS =============
+            self.stdout.write("\n💼 Creando patrocinios...")
+        
+            sponsorships = [
+                Sponsorship(
+                    sponsor=sponsor,
+                    event_id=event['id'],
+                    tier=sponsor.tier,
+                    contribution_amount=TIER_CONTRIBUTIONS[sponsor.tier.name],
+                    amount_paid=PAID_BY_TIER[sponsor.tier.name],
+                    payment_status='partial',
+                    is_active=True,
+                    is_public=True
+                )
+                for sponsor, event in zip(sponsors, events)
+            ]
+            # Lo pagado y el estado de pago no se sobrescriben al re-ejecutar
+            new_sponsorships = create_missing(
+                Sponsorship, sponsorships, 'sponsor_id', 'event_id',
+                update_fields=['tier', 'contribution_amount', 'is_active', 'is_public']
+            )
+            self.report('patrocinios', [
+                f"{sponsorship.sponsor.name} → {event_titles[sponsorship.event_id]}"
+                for sponsorship in new_sponsorships
+            ])
+        
+        self.stdout.write("\n✅ ¡Datos de prueba creados exitosamente!")
+        self.stdout.write("\n📝 Credenciales de acceso:")
+        self.stdout.write("=" * 50)
+        self.stdout.write("Admin: username='admin', password='admin123'")
+        self.stdout.write("Sarah: username='sarah', password='sarah123'")
+        self.stdout.write("Karen: username='karen', password='karen123'")
+        self.stdout.write("Neyireth: username='neyireth', password='neyireth123'")
+        self.stdout.write("Aslhy (Líder): username='aslhy', password='aslhy123'")
+        self.stdout.write("=" * 50)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class SponsorsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.sponsors'
+
+    def ready(self):
+        """Importar signals cuando la app esté lista"""
+        import apps.sponsors.signals
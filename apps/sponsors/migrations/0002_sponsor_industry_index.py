@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sponsors', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sponsor',
+            index=models.Index(fields=['is_active', 'industry'], name='sponsors_is_acti_b116f0_idx'),
+        ),
+    ]
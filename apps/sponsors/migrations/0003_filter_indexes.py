@@ -0,0 +1,25 @@
+# Generated by Django 5.1 on 2026-10-15 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sponsors', '0002_sponsor_industry_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sponsorship',
+            index=models.Index(fields=['payment_status', 'payment_due_date'], name='sponsorship_payment_b2e3a7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sponsorship',
+            index=models.Index(fields=['event', 'tier', 'contribution_amount'], name='sponsorship_event_i_3df5e0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sponsorbenefit',
+            index=models.Index(fields=['is_delivered', 'sponsorship'], name='sponsor_ben_is_deli_802f6b_idx'),
+        ),
+    ]
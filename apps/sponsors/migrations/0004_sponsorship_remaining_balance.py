@@ -0,0 +1,19 @@
+# Generated by Django 5.1 on 2026-10-15 11:00
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sponsors', '0003_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sponsorship',
+            name='remaining_balance',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('contribution_amount'), '-', models.F('amount_paid')), output_field=models.DecimalField(decimal_places=2, max_digits=12), verbose_name='Saldo pendiente'),
+        ),
+    ]
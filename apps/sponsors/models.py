@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, URLValidator
+from django.utils.functional import cached_property
 from apps.events.models import Event
 
 
@@ -98,6 +99,13 @@ class SponsorTier(models.Model):
     def __str__(self):
         return self.name
 
+    @cached_property
+    def parsed_benefits(self):
+        """Beneficios del nivel como tupla, sin líneas vacías"""
+        return tuple(
+            line.strip() for line in self.benefits.split('\n') if line.strip()
+        )
+
 
 class Sponsor(models.Model):
     """Patrocinadores de eventos"""
@@ -198,6 +206,7 @@ class Sponsor(models.Model):
         ordering = ['name']
         indexes = [
             models.Index(fields=['status', 'is_active']),
+            models.Index(fields=['is_active', 'industry']),
         ]
 
     def __str__(self):
@@ -258,6 +267,12 @@ class Sponsorship(models.Model):
         default=0,
         verbose_name="Monto pagado"
     )
+    remaining_balance = models.GeneratedField(
+        expression=models.F('contribution_amount') - models.F('amount_paid'),
+        output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        db_persist=True,
+        verbose_name="Saldo pendiente"
+    )
     
     # Fechas importantes
     contract_signed_date = models.DateField(
@@ -316,15 +331,18 @@ class Sponsorship(models.Model):
         ordering = ['-contribution_amount']
         indexes = [
             models.Index(fields=['event', 'is_public']),
+            models.Index(fields=['payment_status', 'payment_due_date']),
+            models.Index(fields=['event', 'tier', 'contribution_amount']),
         ]
 
     def __str__(self):
         return f"{self.sponsor.name} - {self.event.title}"
 
-    @property
-    def remaining_balance(self):
-        """Calcula el saldo pendiente"""
-        return self.contribution_amount - self.amount_paid
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # remaining_balance lo calcula la base de datos: se descarta el valor
+        # en memoria para que el siguiente acceso lo lea ya actualizado
+        self.__dict__.pop('remaining_balance', None)
 
     @property
     def payment_progress_percentage(self):
@@ -377,6 +395,9 @@ class SponsorBenefit(models.Model):
         verbose_name = 'Beneficio de Patrocinador'
         verbose_name_plural = 'Beneficios de Patrocinadores'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['is_delivered', 'sponsorship']),
+        ]
 
     def __str__(self):
         return f"{self.benefit_name} - {self.sponsorship}"
\ No newline at end of file
@@ -3,6 +3,8 @@ from django.db import transaction
 from apps.events.models import Event
 from .models import SponsorTier, Sponsor, Sponsorship, SponsorBenefit
 
+WEBSITE_SCHEMES = ("http://", "https://")
+
 
 class SponsorTierSerializer(serializers.ModelSerializer):
     """Serializer para niveles de patrocinio"""
@@ -87,7 +89,11 @@ class SponsorListSerializer(serializers.ModelSerializer):
 
     def get_active_sponsorships(self, obj):
         """Cantidad de patrocinios activos"""
-        return obj.sponsorships.filter(is_active=True).count()
+        # Anotado por los ViewSets para evitar un COUNT por fila
+        count = getattr(obj, "active_sponsorships_count", None)
+        if count is None:
+            count = obj.sponsorships.filter(is_active=True).count()
+        return count
 
 
 class SponsorDetailSerializer(serializers.ModelSerializer):
@@ -147,14 +153,20 @@ class SponsorDetailSerializer(serializers.ModelSerializer):
 
     def get_sponsored_events(self, obj):
         """Lista de eventos patrocinados"""
-        sponsorships = obj.sponsorships.filter(is_active=True).select_related("event")
+        sponsorships = obj.sponsorships.filter(is_active=True).values(
+            "event_id",
+            "event__title",
+            "event__start_date",
+            "contribution_amount",
+            "tier__name",
+        )
         return [
             {
-                "id": sp.event.id,
-                "title": sp.event.title,
-                "start_date": sp.event.start_date,
-                "contribution": float(sp.contribution_amount),
-                "tier": sp.tier.name,
+                "id": sp["event_id"],
+                "title": sp["event__title"],
+                "start_date": sp["event__start_date"],
+                "contribution": float(sp["contribution_amount"]),
+                "tier": sp["tier__name"],
             }
             for sp in sponsorships
         ]
@@ -165,7 +177,7 @@ class SponsorDetailSerializer(serializers.ModelSerializer):
 
     def validate_website(self, value):
         """Validar URL del sitio web"""
-        if value and not value.startswith(("http://", "https://")):
+        if value and not value.startswith(WEBSITE_SCHEMES):
             return f"https://{value}"
         return value
 
@@ -244,7 +256,11 @@ class SponsorshipListSerializer(serializers.ModelSerializer):
 
     def get_payment_progress(self, obj):
         """Progreso de pago en porcentaje"""
-        return round(obj.payment_progress_percentage, 2)
+        # Los querysets del ViewSet ya traen el porcentaje calculado en SQL
+        progress = getattr(obj, "payment_progress", None)
+        if progress is None:
+            progress = obj.payment_progress_percentage
+        return round(progress, 2)
 
 
 class SponsorshipDetailSerializer(serializers.ModelSerializer):
@@ -343,21 +359,24 @@ class SponsorshipDetailSerializer(serializers.ModelSerializer):
         sponsorship = super().create(validated_data)
         
         # Crear beneficios automáticos basados en el tier
-        tier_benefits = sponsorship.tier.benefits.split('\n')
-        for benefit_name in tier_benefits:
-            if benefit_name.strip():
-                SponsorBenefit.objects.create(
-                    sponsorship=sponsorship,
-                    benefit_name=benefit_name.strip()
-                )
+        for benefit_name in sponsorship.tier.parsed_benefits:
+            SponsorBenefit.objects.create(
+                sponsorship=sponsorship,
+                benefit_name=benefit_name
+            )
         
         return sponsorship
 
 
 class SponsorshipPaymentSerializer(serializers.Serializer):
-    """Serializer para registrar pagos de patrocinio"""
+    """
+    Serializer para registrar pagos de patrocinio
+
+    El patrocinio puede llegar ya cargado en context['sponsorship'];
+    en ese caso sponsorship_id no es necesario.
+    """
 
-    sponsorship_id = serializers.IntegerField()
+    sponsorship_id = serializers.IntegerField(required=False)
     payment_amount = serializers.DecimalField(max_digits=12, decimal_places=2)
     payment_date = serializers.DateField(required=False)
     payment_method = serializers.CharField(max_length=100, required=False)
@@ -375,7 +394,13 @@ class SponsorshipPaymentSerializer(serializers.Serializer):
 
     def validate(self, data):
         """Validaciones del pago"""
-        sponsorship = Sponsorship.objects.get(id=data["sponsorship_id"])
+        sponsorship = self.context.get("sponsorship")
+        if sponsorship is None:
+            if "sponsorship_id" not in data:
+                raise serializers.ValidationError(
+                    {"sponsorship_id": "Este campo es requerido."}
+                )
+            sponsorship = Sponsorship.objects.get(id=data["sponsorship_id"])
         payment_amount = data["payment_amount"]
 
         # Validar que no exceda el monto pendiente
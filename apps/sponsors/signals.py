@@ -0,0 +1,34 @@
+"""
+Signals para invalidar cachés de patrocinadores
+Ubicación: apps/sponsors/signals.py
+"""
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.core.cache import cache
+from .models import SponsorTier, Sponsor, Sponsorship
+from config.utils.cache_utils import bump_cache_version
+
+SPONSOR_TIER_CACHE = 'sponsortier'
+FEATURED_SPONSORS_CACHE_KEY = 'sponsor:featured:v1'
+
+
+@receiver([post_save, post_delete], sender=SponsorTier)
+@receiver([post_save, post_delete], sender=Sponsor)
+def invalidate_sponsor_tier_cache(sender, **kwargs):
+    """
+    Invalida las respuestas cacheadas de niveles de patrocinio
+    (sponsors_count depende también de los patrocinadores)
+    """
+    bump_cache_version(SPONSOR_TIER_CACHE)
+
+
+@receiver([post_save, post_delete], sender=SponsorTier)
+@receiver([post_save, post_delete], sender=Sponsor)
+@receiver([post_save, post_delete], sender=Sponsorship)
+def invalidate_featured_sponsors_cache(sender, **kwargs):
+    """
+    Invalida el listado de patrocinadores destacados
+    (incluye el conteo de patrocinios activos)
+    """
+    cache.delete(FEATURED_SPONSORS_CACHE_KEY)
@@ -1,3 +1,184 @@
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APITestCase, APIClient, APIRequestFactory
+from rest_framework import status
+from decimal import Decimal
 
-# Create your tests here.
+from .models import SponsorTier, Sponsor, Sponsorship
+from .serializers import SponsorshipPaymentSerializer
+from apps.tickets.factories import UserFactory, EventFactory
+from config.pagination import CachedCountPagination
+
+
+class SponsorshipAPITest(APITestCase):
+    """Tests para la API de patrocinios"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organizer = UserFactory(username='organizer')
+        cls.event = EventFactory(organizer=cls.organizer)
+        cls.tier = SponsorTier.objects.create(
+            name="Gold",
+            min_contribution=Decimal('5000.00'),
+            benefits="Logo en el escenario"
+        )
+        cls.sponsor = Sponsor.objects.create(
+            name="Acme",
+            description="Patrocinador de prueba",
+            contact_person="Ana",
+            contact_email="ana@acme.com",
+            contact_phone="3000000000",
+            logo='sponsors/logos/acme.png'
+        )
+        cls.sponsorship = Sponsorship.objects.create(
+            sponsor=cls.sponsor,
+            event=cls.event,
+            tier=cls.tier,
+            contribution_amount=Decimal('10000.00')
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.organizer)
+
+    def test_register_payment_updates_balance(self):
+        """Test el saldo pendiente refleja el pago registrado"""
+        response = self.client.post(
+            reverse('sponsorship-register-payment', args=[self.sponsorship.id]),
+            {'payment_amount': '3000.00'},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['sponsorship']['remaining_balance'], Decimal('7000.00')
+        )
+
+        self.sponsorship.refresh_from_db()
+        self.assertEqual(self.sponsorship.amount_paid, Decimal('3000.00'))
+        self.assertEqual(self.sponsorship.remaining_balance, Decimal('7000.00'))
+        self.assertEqual(self.sponsorship.payment_status, 'partial')
+
+    def test_mark_completed_with_balance(self):
+        """Test no se completa un patrocinio con saldo pendiente"""
+        response = self.client.post(
+            reverse('sponsorship-mark-completed', args=[self.sponsorship.id])
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.sponsorship.refresh_from_db()
+        self.assertEqual(self.sponsorship.payment_status, 'pending')
+
+    def test_payment_serializer_with_context(self):
+        """Test el patrocinio puede llegar solo por el contexto"""
+        serializer = SponsorshipPaymentSerializer(
+            data={'payment_amount': '2500.00'},
+            context={'sponsorship': self.sponsorship}
+        )
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+
+        self.sponsorship.refresh_from_db()
+        self.assertEqual(self.sponsorship.amount_paid, Decimal('2500.00'))
+
+    def test_payment_serializer_with_sponsorship_id(self):
+        """Test sin contexto el patrocinio se busca por sponsorship_id"""
+        serializer = SponsorshipPaymentSerializer(data={
+            'sponsorship_id': self.sponsorship.id,
+            'payment_amount': '10000.00'
+        })
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+
+        self.sponsorship.refresh_from_db()
+        self.assertEqual(self.sponsorship.remaining_balance, Decimal('0.00'))
+        self.assertEqual(self.sponsorship.payment_status, 'completed')
+
+    def test_payment_serializer_requires_sponsorship(self):
+        """Test sin contexto ni sponsorship_id el pago es inválido"""
+        serializer = SponsorshipPaymentSerializer(data={'payment_amount': '100.00'})
+
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('sponsorship_id', serializer.errors)
+
+    def test_register_payment_overpayment(self):
+        """Test un pago mayor al saldo pendiente se rechaza"""
+        response = self.client.post(
+            reverse('sponsorship-register-payment', args=[self.sponsorship.id]),
+            {'payment_amount': '10000.01'},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.sponsorship.refresh_from_db()
+        self.assertEqual(self.sponsorship.amount_paid, Decimal('0.00'))
+
+
+class CachedCountPaginationTest(TestCase):
+    """Tests para la paginación con total cacheado"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for name in ("Platinum", "Gold", "Silver"):
+            SponsorTier.objects.create(
+                name=name,
+                min_contribution=Decimal('1000.00'),
+                benefits="Logo en el sitio"
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def paginate(self, object_list, page):
+        """Pagina de a 2 elementos y devuelve el Paginator usado"""
+        pagination = CachedCountPagination()
+        pagination.page_size = 2
+        request = Request(APIRequestFactory().get('/', {'page': page}))
+        pagination.paginate_queryset(object_list, request)
+        return pagination.page.paginator
+
+    def add_tier(self):
+        SponsorTier.objects.create(
+            name="Bronze",
+            min_contribution=Decimal('500.00'),
+            benefits="Mención en redes"
+        )
+
+    def test_later_pages_reuse_cached_count(self):
+        """Test la página 2 reutiliza el total guardado por la página 1"""
+        queryset = SponsorTier.objects.filter(is_active=True)
+        self.assertEqual(self.paginate(queryset, 1).count, 3)
+
+        self.add_tier()
+
+        self.assertEqual(self.paginate(queryset, 2).count, 3)
+
+    def test_first_page_refreshes_count(self):
+        """Test la página 1 recalcula el total tras una inserción"""
+        queryset = SponsorTier.objects.filter(is_active=True)
+        self.paginate(queryset, 1)
+
+        self.add_tier()
+
+        self.assertEqual(self.paginate(queryset, 1).count, 4)
+        self.assertEqual(self.paginate(queryset, 2).count, 4)
+
+    def test_count_cached_per_query(self):
+        """Test cada consulta SQL tiene su propio total"""
+        self.paginate(SponsorTier.objects.filter(is_active=True), 1)
+
+        paginator = self.paginate(SponsorTier.objects.filter(name="Gold"), 1)
+
+        self.assertEqual(paginator.count, 1)
+
+    def test_paginate_plain_list(self):
+        """Test una lista sin .query se pagina con un count normal"""
+        paginator = self.paginate(list(range(5)), 3)
+
+        self.assertEqual(paginator.count, 5)
+        self.assertEqual(paginator.num_pages, 3)
+        self.assertEqual(list(paginator.page(3)), [4])
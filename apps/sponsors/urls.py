@@ -1,4 +1,3 @@
-from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
     SponsorTierViewSet, SponsorViewSet,
@@ -11,6 +10,4 @@ router.register(r'sponsors', SponsorViewSet, basename='sponsor')
 router.register(r'sponsorships', SponsorshipViewSet, basename='sponsorship')
 router.register(r'sponsor-benefits', SponsorBenefitViewSet, basename='sponsorbenefit')
 
-urlpatterns = [
-    path('', include(router.urls)),
-]
\ No newline at end of file
+urlpatterns = router.urls
\ No newline at end of file
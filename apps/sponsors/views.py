@@ -4,7 +4,13 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from django_filters.rest_framework import DjangoFilterBackend
 from django.db import transaction
-from django.db.models import Sum, Count, Q
+from django.utils import timezone
+from django.core.cache import cache
+from django.db.models import (
+    Sum, Count, Q, F, Case, When, Value, DecimalField, OuterRef, Subquery,
+    Prefetch
+)
+from django.db.models.functions import Coalesce, Now
 
 from .models import SponsorTier, Sponsor, Sponsorship, SponsorBenefit
 from .serializers import (
@@ -14,7 +20,68 @@ from .serializers import (
     SponsorStatisticsSerializer
 )
 from .filters import SponsorFilter, SponsorshipFilter
+from .signals import SPONSOR_TIER_CACHE, FEATURED_SPONSORS_CACHE_KEY
 from config.permissions import IsSponsorManagerOrReadOnly
+from config.pagination import CachedCountPagination
+from config.utils.cache_utils import versioned_cache_key
+
+SPONSOR_TIER_CACHE_TIMEOUT = 60
+FEATURED_SPONSORS_CACHE_TIMEOUT = 60
+SPONSORSHIP_STATS_CACHE_TIMEOUT = 60 * 5
+
+# Columnas que realmente usa SponsorshipListSerializer
+SPONSORSHIP_LIST_FIELDS = (
+    'id', 'contribution_amount', 'amount_paid', 'remaining_balance',
+    'payment_status', 'is_active',
+    'sponsor', 'sponsor__name', 'event', 'event__title', 'tier', 'tier__name',
+)
+
+
+def with_active_sponsorships_count(queryset):
+    """Anota la cantidad de patrocinios activos usada por SponsorListSerializer"""
+    active_sponsorships = Sponsorship.objects.filter(
+        sponsor=OuterRef('pk'),
+        is_active=True
+    ).order_by().values('sponsor').annotate(total=Count('id')).values('total')
+    
+    return queryset.annotate(
+        active_sponsorships_count=Coalesce(Subquery(active_sponsorships), 0)
+    )
+
+
+def top_contributors(queryset, limit=None):
+    """Ranking de patrocinadores por contribución total dentro de un queryset"""
+    rows = queryset.values_list(
+        'sponsor__id', 'sponsor__name'
+    ).annotate(
+        total=Sum('contribution_amount')
+    ).order_by('-total')
+    if limit is not None:
+        rows = rows[:limit]
+    
+    return [
+        {'id': sponsor_id, 'name': name, 'total_contribution': float(total)}
+        for sponsor_id, name, total in rows
+    ]
+
+
+class CachedQuerysetMixin:
+    """
+    Construye el queryset base una sola vez por petición
+
+    Las acciones, los filtros y la paginación llaman varias veces a
+    get_queryset(); los que lo usan siempre encadenan filter()/get(), que
+    clonan, así que compartir la instancia base es seguro.
+    """
+    
+    def initial(self, request, *args, **kwargs):
+        self._base_queryset = None
+        super().initial(request, *args, **kwargs)
+    
+    def get_queryset(self):
+        if getattr(self, '_base_queryset', None) is None:
+            self._base_queryset = super().get_queryset()
+        return self._base_queryset
 
 
 class SponsorTierViewSet(viewsets.ModelViewSet):
@@ -34,6 +101,24 @@ class SponsorTierViewSet(viewsets.ModelViewSet):
     ordering_fields = ['priority_level', 'min_contribution', 'display_order']
     ordering = ['-priority_level', 'display_order']
     
+    def _cached_response(self, request, handler, *args, **kwargs):
+        """Sirve la respuesta desde caché; se invalida vía signals"""
+        key = versioned_cache_key(SPONSOR_TIER_CACHE, request.get_full_path())
+        data = cache.get(key)
+        if data is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            data = response.data
+            cache.set(key, data, SPONSOR_TIER_CACHE_TIMEOUT)
+        return Response(data)
+    
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(request, super().list, *args, **kwargs)
+    
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(request, super().retrieve, *args, **kwargs)
+    
     @action(detail=False, methods=['get'])
     def public(self, request):
         """
@@ -51,13 +136,15 @@ class SponsorTierViewSet(viewsets.ModelViewSet):
         GET /api/sponsor-tiers/{id}/sponsors/
         """
         tier = self.get_object()
-        sponsors = tier.sponsors.filter(is_active=True)
+        sponsors = with_active_sponsorships_count(
+            tier.sponsors.filter(is_active=True).select_related('tier')
+        )
         
         serializer = SponsorListSerializer(sponsors, many=True)
         return Response(serializer.data)
 
 
-class SponsorViewSet(viewsets.ModelViewSet):
+class SponsorViewSet(CachedQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar patrocinadores
     
@@ -67,8 +154,11 @@ class SponsorViewSet(viewsets.ModelViewSet):
     update: Actualizar patrocinador
     destroy: Eliminar patrocinador
     """
-    queryset = Sponsor.objects.filter(is_active=True).select_related('tier')
+    queryset = with_active_sponsorships_count(
+        Sponsor.objects.filter(is_active=True).select_related('tier')
+    )
     permission_classes = [IsSponsorManagerOrReadOnly]
+    pagination_class = CachedCountPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = SponsorFilter
     search_fields = ['name', 'industry', 'description']
@@ -87,13 +177,19 @@ class SponsorViewSet(viewsets.ModelViewSet):
         Endpoint personalizado: Patrocinadores destacados
         GET /api/sponsors/featured/
         """
-        sponsors = self.get_queryset().filter(
-            tier__homepage_featured=True,
-            status='active'
-        ).order_by('-tier__priority_level')[:10]
-        
-        serializer = SponsorListSerializer(sponsors, many=True)
-        return Response(serializer.data)
+        def build_featured():
+            sponsors = self.get_queryset().filter(
+                tier__homepage_featured=True,
+                status='active'
+            ).order_by('-tier__priority_level')[:10]
+            return SponsorListSerializer(sponsors, many=True).data
+        
+        data = cache.get_or_set(
+            FEATURED_SPONSORS_CACHE_KEY,
+            build_featured,
+            FEATURED_SPONSORS_CACHE_TIMEOUT
+        )
+        return Response(data)
     
     @action(detail=False, methods=['get'])
     def by_industry(self, request):
@@ -116,7 +212,9 @@ class SponsorViewSet(viewsets.ModelViewSet):
         GET /api/sponsors/{id}/sponsorships/
         """
         sponsor = self.get_object()
-        sponsorships = sponsor.sponsorships.filter(is_active=True)
+        sponsorships = sponsor.sponsorships.filter(is_active=True).select_related(
+            'sponsor', 'event', 'tier'
+        )
         
         serializer = SponsorshipListSerializer(sponsorships, many=True)
         return Response(serializer.data)
@@ -129,34 +227,37 @@ class SponsorViewSet(viewsets.ModelViewSet):
         """
         sponsor = self.get_object()
         
-        sponsorships = sponsor.sponsorships.filter(is_active=True)
+        # Una sola consulta con agregaciones condicionales
+        agg = sponsor.sponsorships.filter(is_active=True).aggregate(
+            total_contribution=Sum('contribution_amount'),
+            total_paid=Sum('amount_paid'),
+            active_sponsorships=Count('id'),
+            events_sponsored=Count('event', distinct=True),
+            completed=Count('id', filter=Q(payment_status='completed')),
+            partial=Count('id', filter=Q(payment_status='partial')),
+            pending=Count('id', filter=Q(payment_status='pending')),
+        )
+        
+        total_contribution = agg['total_contribution'] or 0
+        total_paid = agg['total_paid'] or 0
         
         summary = {
-            'total_contribution': sponsorships.aggregate(
-                total=Sum('contribution_amount')
-            )['total'] or 0,
-            'total_paid': sponsorships.aggregate(
-                total=Sum('amount_paid')
-            )['total'] or 0,
-            'pending_balance': sponsorships.aggregate(
-                total=Sum('contribution_amount')
-            )['total'] or 0,
-            'active_sponsorships': sponsorships.count(),
-            'events_sponsored': sponsorships.values('event').distinct().count(),
+            'total_contribution': total_contribution,
+            'total_paid': total_paid,
+            'pending_balance': total_contribution - total_paid,
+            'active_sponsorships': agg['active_sponsorships'],
+            'events_sponsored': agg['events_sponsored'],
             'payment_status_breakdown': {
-                'completed': sponsorships.filter(payment_status='completed').count(),
-                'partial': sponsorships.filter(payment_status='partial').count(),
-                'pending': sponsorships.filter(payment_status='pending').count(),
+                'completed': agg['completed'],
+                'partial': agg['partial'],
+                'pending': agg['pending'],
             }
         }
         
-        # Calcular balance pendiente real
-        summary['pending_balance'] = summary['total_contribution'] - summary['total_paid']
-        
         return Response(summary)
 
 
-class SponsorshipViewSet(viewsets.ModelViewSet):
+class SponsorshipViewSet(CachedQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar patrocinios
     
@@ -168,8 +269,16 @@ class SponsorshipViewSet(viewsets.ModelViewSet):
     """
     queryset = Sponsorship.objects.filter(is_active=True).select_related(
         'sponsor', 'event', 'tier'
+    ).annotate(
+        # Progreso de pago calculado por la base de datos, no fila a fila en Python
+        payment_progress=Case(
+            When(contribution_amount=0, then=Value(0)),
+            default=F('amount_paid') * 100 / F('contribution_amount'),
+            output_field=DecimalField(max_digits=7, decimal_places=2),
+        )
     )
     permission_classes = [IsSponsorManagerOrReadOnly]
+    pagination_class = CachedCountPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = SponsorshipFilter
     search_fields = ['sponsor__name', 'event__title']
@@ -184,6 +293,13 @@ class SponsorshipViewSet(viewsets.ModelViewSet):
             return SponsorshipPaymentSerializer
         return SponsorshipDetailSerializer
     
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'register_payment':
+            # Bloquear solo la fila del patrocinio, no las tablas del select_related
+            queryset = queryset.select_for_update(of=('self',))
+        return queryset
+    
     @action(detail=False, methods=['get'])
     def by_event(self, request):
         """
@@ -201,7 +317,9 @@ class SponsorshipViewSet(viewsets.ModelViewSet):
         sponsorships = self.get_queryset().filter(
             event_id=event_id,
             is_public=True
-        ).order_by('-tier__priority_level', '-contribution_amount')
+        ).order_by(
+            '-tier__priority_level', '-contribution_amount'
+        ).only(*SPONSORSHIP_LIST_FIELDS)
         
         serializer = SponsorshipListSerializer(sponsorships, many=True)
         return Response(serializer.data)
@@ -214,7 +332,12 @@ class SponsorshipViewSet(viewsets.ModelViewSet):
         """
         sponsorships = self.get_queryset().filter(
             Q(payment_status='pending') | Q(payment_status='partial')
-        ).order_by('payment_due_date')
+        ).order_by('payment_due_date').only(*SPONSORSHIP_LIST_FIELDS)
+        
+        page = self.paginate_queryset(sponsorships)
+        if page is not None:
+            serializer = SponsorshipListSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
         
         serializer = SponsorshipListSerializer(sponsorships, many=True)
         return Response(serializer.data)
@@ -234,11 +357,11 @@ class SponsorshipViewSet(viewsets.ModelViewSet):
         """
         sponsorship = self.get_object()
         
-        # Agregar sponsorship_id al data
-        data = request.data.copy()
-        data['sponsorship_id'] = sponsorship.id
+        # El patrocinio ya cargado viaja en el contexto, sin copiar request.data
+        context = self.get_serializer_context()
+        context['sponsorship'] = sponsorship
         
-        serializer = self.get_serializer(data=data)
+        serializer = self.get_serializer(data=request.data, context=context)
         serializer.is_valid(raise_exception=True)
         
         updated_sponsorship = serializer.save()
@@ -265,8 +388,11 @@ class SponsorshipViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        sponsorship.payment_status = 'completed'
-        sponsorship.save()
+        # UPDATE de una sola columna, sin reescribir la fila completa
+        Sponsorship.objects.filter(pk=sponsorship.pk).update(
+            payment_status='completed',
+            updated_at=Now()
+        )
         
         return Response({
             'success': True,
@@ -280,7 +406,10 @@ class SponsorshipViewSet(viewsets.ModelViewSet):
         GET /api/sponsorships/{id}/benefits/
         """
         sponsorship = self.get_object()
-        benefits = sponsorship.delivered_benefits.all()
+        benefits = sponsorship.delivered_benefits.select_related(
+            'sponsorship__sponsor', 'sponsorship__event',
+            'sponsorship__tier', 'delivered_by'
+        )
         
         serializer = SponsorBenefitSerializer(benefits, many=True)
         return Response(serializer.data)
@@ -291,26 +420,39 @@ class SponsorshipViewSet(viewsets.ModelViewSet):
         Endpoint personalizado: Estadísticas generales de patrocinios
         GET /api/sponsorships/statistics/
         """
-        queryset = self.get_queryset()
-        
         # Filtro opcional por evento
         event_id = request.query_params.get('event_id')
+        
+        # Las estadísticas se recalculan como máximo cada pocos minutos
+        data = cache.get_or_set(
+            f'sponsorship:stats:{event_id or "all"}',
+            lambda: self._compute_statistics(event_id),
+            SPONSORSHIP_STATS_CACHE_TIMEOUT
+        )
+        return Response(data)
+    
+    def _compute_statistics(self, event_id=None):
+        """Agregados de patrocinios, opcionalmente filtrados por evento"""
+        queryset = self.get_queryset()
         if event_id:
             queryset = queryset.filter(event_id=event_id)
         
-        total_contribution = queryset.aggregate(
-            total=Sum('contribution_amount')
-        )['total'] or 0
-        
-        total_paid = queryset.aggregate(
-            total=Sum('amount_paid')
-        )['total'] or 0
+        totals = queryset.aggregate(
+            total_contribution=Sum('contribution_amount'),
+            total_paid=Sum('amount_paid'),
+            total_sponsors=Count('sponsor', distinct=True),
+            active_sponsors=Count(
+                'sponsor',
+                distinct=True,
+                filter=Q(sponsor__status='active')
+            )
+        )
+        total_contribution = totals['total_contribution'] or 0
+        total_paid = totals['total_paid'] or 0
         
         stats = {
-            'total_sponsors': queryset.values('sponsor').distinct().count(),
-            'active_sponsors': queryset.filter(
-                sponsor__status='active'
-            ).values('sponsor').distinct().count(),
+            'total_sponsors': totals['total_sponsors'],
+            'active_sponsors': totals['active_sponsors'],
             'total_contribution': total_contribution,
             'total_paid': total_paid,
             'pending_balance': total_contribution - total_paid,
@@ -330,26 +472,12 @@ class SponsorshipViewSet(viewsets.ModelViewSet):
         }
         
         # Top contribuyentes
-        top = queryset.values(
-            'sponsor__name', 'sponsor__id'
-        ).annotate(
-            total=Sum('contribution_amount')
-        ).order_by('-total')[:5]
-        
-        stats['top_contributors'] = [
-            {
-                'id': item['sponsor__id'],
-                'name': item['sponsor__name'],
-                'total_contribution': float(item['total'])
-            }
-            for item in top
-        ]
+        stats['top_contributors'] = top_contributors(queryset, limit=5)
         
-        serializer = SponsorStatisticsSerializer(stats)
-        return Response(serializer.data)
+        return SponsorStatisticsSerializer(stats).data
 
 
-class SponsorBenefitViewSet(viewsets.ModelViewSet):
+class SponsorBenefitViewSet(CachedQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar beneficios de patrocinadores
     
@@ -359,11 +487,22 @@ class SponsorBenefitViewSet(viewsets.ModelViewSet):
     update: Actualizar beneficio
     destroy: Eliminar beneficio
     """
-    queryset = SponsorBenefit.objects.all().select_related(
-        'sponsorship', 'sponsorship__sponsor', 'sponsorship__event'
+    # El patrocinio se trae aparte y solo con las columnas que muestra
+    # sponsorship_info, en lugar de ensanchar cada fila con tres JOIN
+    queryset = SponsorBenefit.objects.select_related('delivered_by').prefetch_related(
+        Prefetch(
+            'sponsorship',
+            queryset=Sponsorship.objects.select_related(
+                'sponsor', 'event', 'tier'
+            ).only(
+                'id', 'sponsor', 'sponsor__name', 'event', 'event__title',
+                'tier', 'tier__name'
+            )
+        )
     )
     serializer_class = SponsorBenefitSerializer
     permission_classes = [IsSponsorManagerOrReadOnly]
+    pagination_class = CachedCountPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     ordering_fields = ['created_at', 'delivered_date']
     ordering = ['-created_at']
@@ -379,13 +518,20 @@ class SponsorBenefitViewSet(viewsets.ModelViewSet):
         """
         benefit = self.get_object()
         
-        from django.utils import timezone
-        
+        now = timezone.now()
         benefit.is_delivered = True
-        benefit.delivered_date = timezone.now().date()
+        benefit.delivered_date = now.date()
         benefit.delivered_by = request.user
         benefit.notes = request.data.get('notes', benefit.notes)
-        benefit.save()
+        benefit.updated_at = now
+        
+        SponsorBenefit.objects.filter(pk=benefit.pk).update(
+            is_delivered=True,
+            delivered_date=benefit.delivered_date,
+            delivered_by=benefit.delivered_by,
+            notes=benefit.notes,
+            updated_at=now
+        )
         
         return Response({
             'success': True,
@@ -406,6 +552,11 @@ class SponsorBenefitViewSet(viewsets.ModelViewSet):
         if sponsorship_id:
             benefits = benefits.filter(sponsorship_id=sponsorship_id)
         
+        page = self.paginate_queryset(benefits)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        
         serializer = self.get_serializer(benefits, many=True)
         return Response(serializer.data)
     
@@ -423,12 +574,14 @@ class SponsorBenefitViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        benefits = self.get_queryset().filter(sponsorship_id=sponsorship_id)
+        # Una sola consulta: los totales se derivan de la lista ya cargada
+        benefits = list(self.get_queryset().filter(sponsorship_id=sponsorship_id))
+        delivered = sum(1 for benefit in benefits if benefit.is_delivered)
         serializer = self.get_serializer(benefits, many=True)
         
         return Response({
-            'total_benefits': benefits.count(),
-            'delivered': benefits.filter(is_delivered=True).count(),
-            'pending': benefits.filter(is_delivered=False).count(),
+            'total_benefits': len(benefits),
+            'delivered': delivered,
+            'pending': len(benefits) - delivered,
             'benefits': serializer.data
         })
\ No newline at end of file
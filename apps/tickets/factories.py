@@ -0,0 +1,77 @@
+"""
+Factories para datos de prueba de tickets
+Ubicación: apps/tickets/factories.py
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+import factory
+from django.contrib.auth.models import User
+from django.utils import timezone
+from factory.django import DjangoModelFactory
+
+from apps.events.models import Category, Venue, Event
+from .models import TicketType
+
+
+class UserFactory(DjangoModelFactory):
+    """Usuario con contraseña conocida (pass123)"""
+    username = factory.Sequence(lambda n: f'user{n}')
+    email = factory.LazyAttribute(lambda o: f'{o.username}@test.com')
+    password = factory.django.Password('pass123')
+
+    class Meta:
+        model = User
+        django_get_or_create = ('username',)
+
+
+class CategoryFactory(DjangoModelFactory):
+    """Categoría con nombre único (el slug se genera en save)"""
+    name = factory.Sequence(lambda n: f'Categoría {n}')
+
+    class Meta:
+        model = Category
+
+
+class VenueFactory(DjangoModelFactory):
+    """Lugar del evento"""
+    name = factory.Faker('company')
+    address = factory.Faker('street_address')
+    city = factory.Faker('city')
+    state = factory.Faker('state')
+    capacity = 1000
+
+    class Meta:
+        model = Venue
+
+
+class EventFactory(DjangoModelFactory):
+    """Evento publicado dentro de 30 días, con registro abierto"""
+    title = factory.Sequence(lambda n: f'Evento {n}')
+    description = factory.Faker('paragraph')
+    category = factory.SubFactory(CategoryFactory)
+    venue = factory.SubFactory(VenueFactory)
+    organizer = factory.SubFactory(UserFactory)
+    start_date = factory.LazyFunction(lambda: timezone.now() + timedelta(days=30))
+    end_date = factory.LazyAttribute(lambda o: o.start_date + timedelta(hours=4))
+    registration_start = factory.LazyFunction(timezone.now)
+    registration_end = factory.LazyAttribute(lambda o: o.start_date - timedelta(days=1))
+    status = 'published'
+    is_published = True
+
+    class Meta:
+        model = Event
+
+
+class TicketTypeFactory(DjangoModelFactory):
+    """Tipo de ticket en venta hasta el día anterior al evento"""
+    event = factory.SubFactory(EventFactory)
+    name = 'General'
+    price = Decimal('50000.00')
+    quantity_available = 100
+    sale_start = factory.LazyFunction(timezone.now)
+    sale_end = factory.LazyAttribute(lambda o: o.event.start_date - timedelta(days=1))
+
+    class Meta:
+        model = TicketType
@@ -30,9 +30,9 @@ class TicketTypeFilter(django_filters.FilterSet):
     
     # Filtros booleanos
     is_active = django_filters.BooleanFilter(field_name='is_active')
-    includes_food = django_filters.BooleanFilter(field_name='includes_food')
-    includes_drink = django_filters.BooleanFilter(field_name='includes_drink')
-    includes_parking = django_filters.BooleanFilter(field_name='includes_parking')
+    includes_food = django_filters.BooleanFilter(method='filter_benefit')
+    includes_drink = django_filters.BooleanFilter(method='filter_benefit')
+    includes_parking = django_filters.BooleanFilter(method='filter_benefit')
     
     # Filtros por disponibilidad
     available = django_filters.BooleanFilter(
@@ -44,6 +44,16 @@ class TicketTypeFilter(django_filters.FilterSet):
         model = TicketType
         fields = ['event', 'name', 'is_active']
     
+    def filter_benefit(self, queryset, name, value):
+        """Filtrar por un beneficio guardado como bit de benefits_mask"""
+        from django.db.models import F
+        bit = TicketType.BENEFIT_FLAGS[name]
+        alias = f'{name}_bit'
+        
+        return queryset.alias(
+            **{alias: F('benefits_mask').bitand(bit)}
+        ).filter(**{alias: bit if value else 0})
+    
     def filter_available(self, queryset, name, value):
         """Filtrar tickets disponibles para la venta"""
         if value:
@@ -63,11 +73,8 @@ class TicketTypeFilter(django_filters.FilterSet):
 class TicketFilter(django_filters.FilterSet):
     """Filtros avanzados para tickets"""
     
-    # Filtros por código
-    ticket_code = django_filters.CharFilter(
-        field_name='ticket_code',
-        lookup_expr='icontains'
-    )
+    # Filtros por código (coincidencia exacta, resuelta por el índice único)
+    ticket_code = django_filters.UUIDFilter(field_name='ticket_code')
     
     # Filtros por comprador
     buyer = django_filters.NumberFilter(field_name='buyer__id')
@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tickettype',
+            index=models.Index(fields=['sale_start', 'sale_end'], name='tt_sale_window_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-15 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0002_tickettype_sale_window_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['status', 'purchase_date'], name='tickets_status_667201_idx'),
+        ),
+    ]
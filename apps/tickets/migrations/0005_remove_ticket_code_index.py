@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-15 12:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0003_ticket_status_purchase_date_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='ticket',
+            name='tickets_ticket__2ef6a4_idx',
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1 on 2026-10-15 12:45
+
+import apps.tickets.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0005_remove_ticket_code_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ticket',
+            name='ticket_code',
+            field=models.UUIDField(default=apps.tickets.models.uuid7, editable=False, unique=True, verbose_name='Código de ticket'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-15 13:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0006_alter_ticket_ticket_code'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='ticket',
+            name='qr_code',
+        ),
+    ]
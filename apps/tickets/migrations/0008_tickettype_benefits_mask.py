@@ -0,0 +1,64 @@
+# Generated by Django 5.1 on 2026-10-15 13:30
+
+from django.db import migrations, models
+from django.db.models import F, IntegerField
+from django.db.models.functions import Cast
+
+
+BENEFIT_FLAGS = {
+    'includes_food': 1,
+    'includes_drink': 2,
+    'includes_parking': 4,
+    'includes_merchandise': 8,
+}
+
+
+def fill_benefits_mask(apps, schema_editor):
+    TicketType = apps.get_model('tickets', 'TicketType')
+    mask = sum(
+        Cast(F(name), IntegerField()) * bit
+        for name, bit in BENEFIT_FLAGS.items()
+    )
+    TicketType.objects.update(benefits_mask=mask)
+
+
+def fill_benefit_flags(apps, schema_editor):
+    TicketType = apps.get_model('tickets', 'TicketType')
+    for ticket_type in TicketType.objects.only('id', 'benefits_mask'):
+        flags = {
+            name: bool(ticket_type.benefits_mask & bit)
+            for name, bit in BENEFIT_FLAGS.items()
+        }
+        TicketType.objects.filter(pk=ticket_type.pk).update(**flags)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0007_remove_ticket_qr_code'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tickettype',
+            name='benefits_mask',
+            field=models.PositiveSmallIntegerField(default=0, help_text='1 comida, 2 bebida, 4 parking, 8 merchandising', verbose_name='Beneficios incluidos'),
+        ),
+        migrations.RunPython(fill_benefits_mask, fill_benefit_flags),
+        migrations.RemoveField(
+            model_name='tickettype',
+            name='includes_food',
+        ),
+        migrations.RemoveField(
+            model_name='tickettype',
+            name='includes_drink',
+        ),
+        migrations.RemoveField(
+            model_name='tickettype',
+            name='includes_parking',
+        ),
+        migrations.RemoveField(
+            model_name='tickettype',
+            name='includes_merchandise',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0008_tickettype_benefits_mask'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tickettype',
+            index=models.Index(fields=['event', 'sale_start', 'sale_end'], name='tt_available_idx'),
+        ),
+    ]
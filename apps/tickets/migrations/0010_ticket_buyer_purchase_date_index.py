@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0009_tickettype_available_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['buyer', '-purchase_date'], name='tix_buyer_idx'),
+        ),
+    ]
@@ -1,10 +1,46 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils import timezone
+from django.utils.functional import cached_property
 from apps.events.models import Event
+import os
+import time
 import uuid
 
 
+def uuid7():
+    """
+    UUID versión 7 (RFC 9562): los primeros 48 bits son el timestamp en
+    milisegundos, así los códigos nuevos se insertan al final del índice
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand_a = int.from_bytes(os.urandom(2), 'big') & 0x0FFF
+    rand_b = int.from_bytes(os.urandom(8), 'big') & 0x3FFFFFFFFFFFFFFF
+    value = (
+        (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+def _benefit_flag(bit, doc):
+    """Propiedad booleana respaldada por un bit de benefits_mask"""
+    def getter(self):
+        return bool(self.benefits_mask & bit)
+
+    def setter(self, value):
+        if value:
+            self.benefits_mask |= bit
+        else:
+            self.benefits_mask &= ~bit
+
+    return property(getter, setter, doc=doc)
+
+
 class TicketType(models.Model):
     """Tipos de tickets para eventos (VIP, General, Early Bird, etc.)"""
     event = models.ForeignKey(
@@ -41,11 +77,22 @@ class TicketType(models.Model):
     sale_end = models.DateTimeField(verbose_name="Fin de ventas")
     is_active = models.BooleanField(default=True, verbose_name="Activo")
     
-    # Beneficios incluidos
-    includes_food = models.BooleanField(default=False, verbose_name="Incluye comida")
-    includes_drink = models.BooleanField(default=False, verbose_name="Incluye bebida")
-    includes_parking = models.BooleanField(default=False, verbose_name="Incluye parking")
-    includes_merchandise = models.BooleanField(default=False, verbose_name="Incluye merchandising")
+    # Beneficios incluidos (un bit por beneficio, ver BENEFIT_FLAGS)
+    BENEFIT_FLAGS = {
+        'includes_food': 1,
+        'includes_drink': 2,
+        'includes_parking': 4,
+        'includes_merchandise': 8,
+    }
+    benefits_mask = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name="Beneficios incluidos",
+        help_text="1 comida, 2 bebida, 4 parking, 8 merchandising"
+    )
+    includes_food = _benefit_flag(1, "Incluye comida")
+    includes_drink = _benefit_flag(2, "Incluye bebida")
+    includes_parking = _benefit_flag(4, "Incluye parking")
+    includes_merchandise = _benefit_flag(8, "Incluye merchandising")
     benefits_description = models.TextField(
         blank=True,
         verbose_name="Descripción de beneficios"
@@ -66,25 +113,35 @@ class TicketType(models.Model):
         ordering = ['event', 'display_order', 'price']
         indexes = [
             models.Index(fields=['event', 'is_active']),
+            models.Index(fields=['sale_start', 'sale_end'], name='tt_sale_window_idx'),
+            # MySQL ignora condition=: índice completo para el endpoint available
+            models.Index(fields=['event', 'sale_start', 'sale_end'], name='tt_available_idx'),
         ]
 
+    # Propiedades calculadas una vez por instancia; save() las descarta
+    CACHED_PROPERTIES = ('quantity_remaining', 'is_sold_out', 'is_on_sale')
+
     def __str__(self):
         return f"{self.event.title} - {self.name}"
 
-    @property
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        for name in self.CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
+
+    @cached_property
     def quantity_remaining(self):
         """Cantidad de tickets disponibles"""
         return max(0, self.quantity_available - self.quantity_sold)
 
-    @property
+    @cached_property
     def is_sold_out(self):
         """Verifica si está agotado"""
         return self.quantity_remaining == 0
 
-    @property
+    @cached_property
     def is_on_sale(self):
         """Verifica si está en período de venta"""
-        from django.utils import timezone
         now = timezone.now()
         return (
             self.is_active and 
@@ -106,16 +163,11 @@ class Ticket(models.Model):
 
     # Identificación única
     ticket_code = models.UUIDField(
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         unique=True,
         verbose_name="Código de ticket"
     )
-    qr_code = models.CharField(
-        max_length=255,
-        blank=True,
-        verbose_name="Código QR"
-    )
     
     # Relaciones
     ticket_type = models.ForeignKey(
@@ -192,24 +244,30 @@ class Ticket(models.Model):
         verbose_name = 'Ticket'
         verbose_name_plural = 'Tickets'
         ordering = ['-purchase_date']
+        # MySQL no soporta índices parciales (condition=): los compuestos
+        # (buyer, status) y (ticket_type, status) cubren las consultas de
+        # tickets activos por comprador y de vendidos por tipo
         indexes = [
-            models.Index(fields=['ticket_code']),
             models.Index(fields=['buyer', 'status']),
             models.Index(fields=['ticket_type', 'status']),
+            models.Index(fields=['status', 'purchase_date']),
+            # Listado "mis tickets": filtra por comprador y ordena por fecha
+            models.Index(fields=['buyer', '-purchase_date'], name='tix_buyer_idx'),
         ]
 
     def __str__(self):
         return f"Ticket {self.ticket_code} - {self.ticket_type.name}"
 
+    @property
+    def qr_code(self):
+        """Contenido del código QR, derivado del código de ticket"""
+        return f"QR-{self.ticket_code}"
+
     def save(self, *args, **kwargs):
         # Calcular precio final si no está definido
         if not self.final_price:
             self.final_price = self.original_price - self.discount_applied
         
-        # Generar código QR si no existe
-        if not self.qr_code:
-            self.qr_code = f"QR-{self.ticket_code}"
-        
         super().save(*args, **kwargs)
 
 
@@ -300,10 +358,15 @@ class DiscountCode(models.Model):
     def __str__(self):
         return self.code
 
-    @property
+    def save(self, *args, **kwargs):
+        # Normalizado en mayúsculas: las búsquedas usan code= sobre el índice único
+        self.code = self.code.strip().upper()
+        super().save(*args, **kwargs)
+        self.__dict__.pop('is_valid', None)
+
+    @cached_property
     def is_valid(self):
         """Verifica si el código es válido"""
-        from django.utils import timezone
         now = timezone.now()
         
         if not self.is_active:
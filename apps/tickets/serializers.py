@@ -1,8 +1,16 @@
 from rest_framework import serializers
+from django.contrib.auth.models import User
 from django.utils import timezone
 from django.db import transaction
-from .models import TicketType, Ticket, DiscountCode
+from django.db.models import F
+from .models import TicketType, Ticket, DiscountCode, uuid7
+from .signals import TICKET_TYPE_CACHE
+from config.utils.cache_utils import bump_cache_version
 from apps.events.models import Event
+from decimal import Decimal
+
+ZERO = Decimal('0')
+HUNDRED = Decimal('100')
 
 
 class TicketTypeSerializer(serializers.ModelSerializer):
@@ -11,6 +19,11 @@ class TicketTypeSerializer(serializers.ModelSerializer):
     quantity_remaining = serializers.ReadOnlyField()
     is_sold_out = serializers.ReadOnlyField()
     is_on_sale = serializers.ReadOnlyField()
+    # Propiedades sobre benefits_mask; se declaran para que sigan siendo editables
+    includes_food = serializers.BooleanField(required=False)
+    includes_drink = serializers.BooleanField(required=False)
+    includes_parking = serializers.BooleanField(required=False)
+    includes_merchandise = serializers.BooleanField(required=False)
     
     class Meta:
         model = TicketType
@@ -60,14 +73,51 @@ class TicketListSerializer(serializers.ModelSerializer):
             'id', 'ticket_code', 'event_title', 'ticket_type_name',
             'buyer_name', 'status', 'purchase_date', 'final_price'
         ]
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Carga en un solo JOIN las relaciones que lee el listado"""
+        return queryset.select_related('ticket_type__event', 'buyer').only(
+            'id', 'ticket_code', 'status', 'purchase_date', 'final_price',
+            'ticket_type', 'ticket_type__name',
+            'ticket_type__event', 'ticket_type__event__title',
+            'buyer', 'buyer__username'
+        )
+
+
+class BuyerInfoSerializer(serializers.ModelSerializer):
+    """Datos del comprador incluidos en el detalle del ticket"""
+    
+    class Meta:
+        model = User
+        fields = ['id', 'username', 'email', 'first_name', 'last_name']
+
+
+class AttendeeInfoSerializer(serializers.Serializer):
+    """Datos del asistente incluidos en el detalle del ticket"""
+    id = serializers.IntegerField(read_only=True)
+    full_name = serializers.CharField(read_only=True)
+    email = serializers.EmailField(read_only=True)
+    phone = serializers.CharField(read_only=True)
+    status = serializers.CharField(read_only=True)
+
+
+class EventInfoSerializer(serializers.ModelSerializer):
+    """Datos del evento y su lugar incluidos en el detalle del ticket"""
+    venue_name = serializers.CharField(source='venue.name', read_only=True)
+    venue_address = serializers.CharField(source='venue.address', read_only=True)
+    
+    class Meta:
+        model = Event
+        fields = ['id', 'title', 'start_date', 'venue_name', 'venue_address']
 
 
 class TicketDetailSerializer(serializers.ModelSerializer):
     """Serializer detallado para tickets"""
     ticket_type_detail = TicketTypeSerializer(source='ticket_type', read_only=True)
-    buyer_info = serializers.SerializerMethodField()
-    attendee_info = serializers.SerializerMethodField()
-    event_info = serializers.SerializerMethodField()
+    buyer_info = BuyerInfoSerializer(source='buyer', read_only=True)
+    attendee_info = AttendeeInfoSerializer(source='attendee', read_only=True)
+    event_info = EventInfoSerializer(source='ticket_type.event', read_only=True)
     
     class Meta:
         model = Ticket
@@ -82,42 +132,9 @@ class TicketDetailSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
         read_only_fields = [
-            'ticket_code', 'qr_code', 'purchase_date',
+            'ticket_code', 'purchase_date',
             'created_at', 'updated_at'
         ]
-    
-    def get_buyer_info(self, obj):
-        """Información del comprador"""
-        return {
-            'id': obj.buyer.id,
-            'username': obj.buyer.username,
-            'email': obj.buyer.email,
-            'first_name': obj.buyer.first_name,
-            'last_name': obj.buyer.last_name,
-        }
-    
-    def get_attendee_info(self, obj):
-        """Información del asistente"""
-        if obj.attendee:
-            return {
-                'id': obj.attendee.id,
-                'full_name': obj.attendee.full_name,
-                'email': obj.attendee.email,
-                'phone': obj.attendee.phone,
-                'status': obj.attendee.status,
-            }
-        return None
-    
-    def get_event_info(self, obj):
-        """Información del evento"""
-        event = obj.ticket_type.event
-        return {
-            'id': event.id,
-            'title': event.title,
-            'start_date': event.start_date,
-            'venue_name': event.venue.name,
-            'venue_address': event.venue.address,
-        }
 
 
 class TicketPurchaseSerializer(serializers.Serializer):
@@ -130,7 +147,9 @@ class TicketPurchaseSerializer(serializers.Serializer):
     def validate_ticket_type_id(self, value):
         """Validar que el tipo de ticket existe"""
         try:
-            ticket_type = TicketType.objects.get(id=value)
+            # Se guarda para reutilizarlo en validate() sin otra consulta
+            ticket_type = TicketType.objects.select_related('event').get(id=value)
+            self._ticket_type = ticket_type
             if not ticket_type.is_on_sale:
                 raise serializers.ValidationError(
                     "Este tipo de ticket no está disponible para la venta"
@@ -141,7 +160,7 @@ class TicketPurchaseSerializer(serializers.Serializer):
     
     def validate(self, data):
         """Validaciones de la compra"""
-        ticket_type = TicketType.objects.get(id=data['ticket_type_id'])
+        ticket_type = self._ticket_type
         quantity = data['quantity']
         
         # Validar cantidad disponible
@@ -159,8 +178,9 @@ class TicketPurchaseSerializer(serializers.Serializer):
         # Validar código de descuento si existe
         if 'discount_code' in data and data['discount_code']:
             try:
+                # Los códigos se guardan en mayúsculas (ver validate_code)
                 discount = DiscountCode.objects.get(
-                    code=data['discount_code'],
+                    code=data['discount_code'].strip().upper(),
                     is_active=True
                 )
                 if not discount.is_valid:
@@ -185,40 +205,67 @@ class TicketPurchaseSerializer(serializers.Serializer):
         quantity = validated_data['quantity']
         discount_obj = validated_data.get('discount_object')
         
+        # validate() solo hace una comprobación optimista; con la fila ya
+        # bloqueada se vuelve a verificar para no sobrevender
+        remaining = ticket_type.quantity_available - ticket_type.quantity_sold
+        if remaining < quantity:
+            raise serializers.ValidationError(
+                f"Solo quedan {remaining} tickets disponibles"
+            )
+        
         # Calcular precios
+        # Se calculan una sola vez y se comparten entre todos los tickets
         original_price = ticket_type.price
-        discount_amount = 0
+        discount_amount = ZERO
         
         if discount_obj:
             if discount_obj.discount_type == 'percentage':
-                discount_amount = (original_price * discount_obj.discount_value) / 100
+                discount_amount = (original_price * discount_obj.discount_value) / HUNDRED
             else:
                 discount_amount = discount_obj.discount_value
         
         final_price = original_price - discount_amount
+        # Total de la orden, disponible para la vista tras save()
+        self.total_price = final_price * quantity
         
-        # Crear tickets
-        tickets = []
-        for _ in range(quantity):
-            ticket = Ticket.objects.create(
+        # Crear tickets en un solo INSERT
+        ticket_codes = [uuid7() for _ in range(quantity)]
+        Ticket.objects.bulk_create([
+            Ticket(
                 ticket_type=ticket_type,
                 buyer=user,
+                ticket_code=code,
                 original_price=original_price,
                 discount_applied=discount_amount,
                 final_price=final_price,
                 payment_method=validated_data['payment_method'],
                 status='paid'
             )
-            tickets.append(ticket)
+            for code in ticket_codes
+        ])
         
-        # Actualizar cantidad vendida
-        ticket_type.quantity_sold += quantity
-        ticket_type.save()
+        # Actualizar cantidad vendida (incremento atómico en la base de datos)
+        TicketType.objects.filter(pk=ticket_type.pk).update(
+            quantity_sold=F('quantity_sold') + quantity
+        )
         
         # Actualizar código de descuento
         if discount_obj:
-            discount_obj.times_used += 1
-            discount_obj.save()
+            DiscountCode.objects.filter(pk=discount_obj.pk).update(
+                times_used=F('times_used') + 1
+            )
+        
+        # bulk_create y update() no disparan signals: invalidar el catálogo
+        # cuando la venta quede confirmada
+        transaction.on_commit(lambda: bump_cache_version(TICKET_TYPE_CACHE))
+        
+        # MySQL no devuelve los ids del bulk_create: se recargan por código,
+        # ya con la cantidad vendida actualizada
+        tickets = list(
+            Ticket.objects.select_related(
+                'ticket_type__event__venue', 'buyer', 'attendee'
+            ).filter(ticket_code__in=ticket_codes)
+        )
         
         return tickets
 
@@ -249,10 +296,12 @@ class DiscountCodeSerializer(serializers.ModelSerializer):
     
     def validate_code(self, value):
         """Validar código único"""
+        # Se compara ya normalizado, igual que se guarda y se busca
+        value = value.strip().upper()
         if self.instance is None:  # Solo en creación
             if DiscountCode.objects.filter(code=value).exists():
                 raise serializers.ValidationError("Este código ya existe")
-        return value.upper()
+        return value
     
     def validate(self, data):
         """Validaciones del código de descuento"""
@@ -278,7 +327,12 @@ class TicketValidationSerializer(serializers.Serializer):
     def validate_ticket_code(self, value):
         """Validar que el ticket existe y es válido"""
         try:
-            ticket = Ticket.objects.get(ticket_code=value)
+            # Se carga con las relaciones de TicketDetailSerializer y se
+            # guarda para que la vista responda sin volver a consultar
+            ticket = Ticket.objects.select_related(
+                'ticket_type__event__venue', 'buyer', 'attendee'
+            ).get(ticket_code=value)
+            self._ticket = ticket
             
             if ticket.status == 'cancelled':
                 raise serializers.ValidationError("Este ticket ha sido cancelado")
@@ -299,4 +353,9 @@ class TicketValidationSerializer(serializers.Serializer):
         except Ticket.DoesNotExist:
             raise serializers.ValidationError("Ticket no encontrado")
         
-        return value
\ No newline at end of file
+        return value
+    
+    def validate(self, data):
+        """Adjuntar el ticket ya cargado en validate_ticket_code"""
+        data['ticket'] = self._ticket
+        return data
\ No newline at end of file
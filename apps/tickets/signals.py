@@ -3,14 +3,17 @@ Signals para enviar emails automáticamente
 Ubicación: apps/tickets/signals.py
 """
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from .models import Ticket
+from .models import Ticket, TicketType
 from config.utils.email_utils import EmailService
+from config.utils.cache_utils import bump_cache_version
 import logging
 
 logger = logging.getLogger('apps')
 
+TICKET_TYPE_CACHE = 'tickettype'
+
 
 @receiver(post_save, sender=Ticket)
 def send_ticket_confirmation_email(sender, instance, created, **kwargs):
@@ -20,6 +23,16 @@ def send_ticket_confirmation_email(sender, instance, created, **kwargs):
     if created and instance.status == 'confirmed':
         try:
             EmailService.send_ticket_confirmation(instance)
-            logger.info(f"Email de confirmación enviado para ticket {instance.id}")
+            logger.info(f"Email de confirmación encolado para ticket {instance.id}")
         except Exception as e:
-            logger.error(f"Error enviando email de ticket {instance.id}: {str(e)}")
\ No newline at end of file
+            logger.error(f"Error enviando email de ticket {instance.id}: {str(e)}")
+
+
+@receiver([post_save, post_delete], sender=TicketType)
+@receiver([post_save, post_delete], sender=Ticket)
+def invalidate_ticket_type_cache(sender, **kwargs):
+    """
+    Invalida el listado cacheado de tipos de tickets
+    (la disponibilidad depende de los tickets vendidos)
+    """
+    bump_cache_version(TICKET_TYPE_CACHE)
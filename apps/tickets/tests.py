@@ -1,50 +1,26 @@
+from django.core.cache import cache
 from django.test import TestCase
-from django.contrib.auth.models import User
+from django.urls import reverse
 from django.utils import timezone
 from datetime import timedelta
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from decimal import Decimal
+import json
+import uuid
 
-from .models import TicketType, Ticket, DiscountCode
-from apps.events.models import Event, Category, Venue
+from .models import Ticket, TicketType, DiscountCode
+from .factories import UserFactory, EventFactory, TicketTypeFactory
+from config.renderers import OrjsonRenderer
 
 
 class TicketTypeModelTest(TestCase):
     """Tests para el modelo TicketType"""
     
-    def setUp(self):
-        user = User.objects.create_user(username='organizer', password='pass123')
-        category = Category.objects.create(name="Música")
-        venue = Venue.objects.create(
-            name="Estadio", address="Calle 1", city="Bogotá",
-            state="Cundinamarca", capacity=1000
-        )
-        
-        now = timezone.now()
-        
-        self.event = Event.objects.create(
-            title="Concierto Rock",
-            description="Evento musical",
-            category=category,
-            venue=venue,
-            organizer=user,
-            start_date=now + timedelta(days=30),
-            end_date=now + timedelta(days=30, hours=4),
-            registration_start=now,
-            registration_end=now + timedelta(days=29),
-            status='published',
-            is_published=True
-        )
-        
-        self.ticket_type = TicketType.objects.create(
-            event=self.event,
-            name="General",
-            price=Decimal('50000.00'),
-            quantity_available=100,
-            sale_start=now,
-            sale_end=now + timedelta(days=29)
-        )
+    @classmethod
+    def setUpTestData(cls):
+        cls.event = EventFactory(title="Concierto Rock")
+        cls.ticket_type = TicketTypeFactory(event=cls.event)
     
     def test_ticket_type_creation(self):
         """Test crear tipo de ticket"""
@@ -78,43 +54,18 @@ class TicketTypeModelTest(TestCase):
 class TicketModelTest(TestCase):
     """Tests para el modelo Ticket"""
     
-    def setUp(self):
-        self.user = User.objects.create_user(username='buyer', password='pass123')
-        organizer = User.objects.create_user(username='organizer', password='pass123')
-        category = Category.objects.create(name="Deportes")
-        venue = Venue.objects.create(
-            name="Estadio", address="Av 1", city="Medellín",
-            state="Antioquia", capacity=500
-        )
-        
-        now = timezone.now()
-        
-        event = Event.objects.create(
-            title="Partido",
-            description="Evento deportivo",
-            category=category,
-            venue=venue,
-            organizer=organizer,
-            start_date=now + timedelta(days=15),
-            end_date=now + timedelta(days=15, hours=2),
-            registration_start=now,
-            registration_end=now + timedelta(days=14),
-            status='published',
-            is_published=True
-        )
-        
-        self.ticket_type = TicketType.objects.create(
-            event=event,
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory(username='buyer')
+        cls.ticket_type = TicketTypeFactory(
             name="VIP",
             price=Decimal('100000.00'),
-            quantity_available=50,
-            sale_start=now,
-            sale_end=now + timedelta(days=14)
+            quantity_available=50
         )
         
-        self.ticket = Ticket.objects.create(
-            ticket_type=self.ticket_type,
-            buyer=self.user,
+        cls.ticket = Ticket.objects.create(
+            ticket_type=cls.ticket_type,
+            buyer=cls.user,
             original_price=Decimal('100000.00'),
             final_price=Decimal('100000.00'),
             status='paid'
@@ -135,35 +86,17 @@ class TicketModelTest(TestCase):
 class DiscountCodeModelTest(TestCase):
     """Tests para el modelo DiscountCode"""
     
-    def setUp(self):
-        user = User.objects.create_user(username='admin', password='pass123')
-        category = Category.objects.create(name="Tecnología")
-        venue = Venue.objects.create(
-            name="Centro", address="Calle 1", city="Cali",
-            state="Valle", capacity=300
-        )
+    @classmethod
+    def setUpTestData(cls):
+        cls.event = EventFactory(title="Tech Summit")
         
         now = timezone.now()
         
-        self.event = Event.objects.create(
-            title="Tech Summit",
-            description="Evento tech",
-            category=category,
-            venue=venue,
-            organizer=user,
-            start_date=now + timedelta(days=20),
-            end_date=now + timedelta(days=20, hours=8),
-            registration_start=now,
-            registration_end=now + timedelta(days=19),
-            status='published',
-            is_published=True
-        )
-        
-        self.discount = DiscountCode.objects.create(
+        cls.discount = DiscountCode.objects.create(
             code="EARLYBIRD",
             discount_type="percentage",
             discount_value=Decimal('20.00'),
-            event=self.event,
+            event=cls.event,
             max_uses=100,
             valid_from=now,
             valid_until=now + timedelta(days=10),
@@ -184,57 +117,75 @@ class DiscountCodeModelTest(TestCase):
         self.discount.save()
         
         self.assertFalse(self.discount.is_valid)
-
-
-class TicketAPITest(APITestCase):
-    """Tests para la API de tickets"""
     
-    def setUp(self):
-        self.client = APIClient()
-        
-        self.user = User.objects.create_user(
-            username='buyer',
-            email='buyer@test.com',
-            password='testpass123'
-        )
+    def test_is_valid_cached_until_save(self):
+        """Test is_valid se calcula una vez por instancia y save() lo refresca"""
+        self.assertTrue(self.discount.is_valid)
         
-        organizer = User.objects.create_user(username='organizer', password='pass123')
-        category = Category.objects.create(name="Conciertos")
-        venue = Venue.objects.create(
-            name="Arena", address="Calle Principal", city="Barranquilla",
-            state="Atlántico", capacity=2000
-        )
+        # Sin guardar se sigue usando el valor calculado
+        self.discount.is_active = False
+        self.assertTrue(self.discount.is_valid)
         
+        self.discount.save()
+        self.assertFalse(self.discount.is_valid)
+    
+    def test_code_stored_upper_case(self):
+        """Test el código se guarda normalizado en mayúsculas"""
         now = timezone.now()
-        
-        self.event = Event.objects.create(
-            title="Concierto Pop",
-            description="Gran concierto",
-            category=category,
-            venue=venue,
-            organizer=organizer,
-            start_date=now + timedelta(days=45),
-            end_date=now + timedelta(days=45, hours=5),
-            registration_start=now,
-            registration_end=now + timedelta(days=44),
-            status='published',
-            is_published=True
+        discount = DiscountCode.objects.create(
+            code=" summer15 ",
+            discount_type="fixed",
+            discount_value=Decimal('15000.00'),
+            valid_from=now,
+            valid_until=now + timedelta(days=10)
         )
         
-        self.ticket_type = TicketType.objects.create(
-            event=self.event,
-            name="General",
+        self.assertEqual(discount.code, "SUMMER15")
+        self.assertTrue(DiscountCode.objects.filter(code="SUMMER15").exists())
+
+
+class TicketAPITest(APITestCase):
+    """Tests para la API de tickets"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory(username='buyer', email='buyer@test.com')
+        cls.event = EventFactory(title="Concierto Pop")
+        cls.ticket_type = TicketTypeFactory(
+            event=cls.event,
             price=Decimal('80000.00'),
             quantity_available=500,
-            sale_start=now,
-            sale_end=now + timedelta(days=44),
             max_per_order=5
         )
     
+    def setUp(self):
+        self.client = APIClient()
+        # Historial de throttling y respuestas cacheadas empiezan vacíos
+        cache.clear()
+    
     def test_list_ticket_types(self):
         """Test listar tipos de tickets"""
-        response = self.client.get('/api/ticket-types/')
+        response = self.client.get(reverse('tickettype-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_available_ticket_types(self):
+        """Test tipos disponibles excluye los agotados"""
+        sold_out = TicketTypeFactory(
+            event=self.event,
+            name="Agotado",
+            quantity_available=10,
+            quantity_sold=10
+        )
+        
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse('tickettype-available'), {'event': self.event.id}
+            )
+        
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [item['id'] for item in response.data]
+        self.assertIn(self.ticket_type.id, ids)
+        self.assertNotIn(sold_out.id, ids)
     
     def test_purchase_ticket_authenticated(self):
         """Test comprar ticket autenticado"""
@@ -246,10 +197,32 @@ class TicketAPITest(APITestCase):
             'payment_method': 'credit_card'
         }
         
-        response = self.client.post('/api/tickets/purchase/', data, format='json')
+        response = self.client.post(reverse('ticket-purchase'), data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(len(response.data['tickets']), 2)
     
+    def test_purchase_updates_inventory(self):
+        """Test la compra crea los tickets y suma la cantidad vendida"""
+        self.client.force_authenticate(user=self.user)
+        
+        data = {
+            'ticket_type_id': self.ticket_type.id,
+            'quantity': 3,
+            'payment_method': 'credit_card'
+        }
+        
+        response = self.client.post(reverse('ticket-purchase'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        
+        codes = {ticket['ticket_code'] for ticket in response.data['tickets']}
+        self.assertEqual(len(codes), 3)
+        self.assertEqual(
+            Ticket.objects.filter(buyer=self.user, ticket_type=self.ticket_type).count(),
+            3
+        )
+        self.ticket_type.refresh_from_db()
+        self.assertEqual(self.ticket_type.quantity_sold, 3)
+    
     def test_purchase_ticket_unauthenticated(self):
         """Test comprar ticket sin autenticación"""
         data = {
@@ -258,7 +231,7 @@ class TicketAPITest(APITestCase):
             'payment_method': 'credit_card'
         }
         
-        response = self.client.post('/api/tickets/purchase/', data, format='json')
+        response = self.client.post(reverse('ticket-purchase'), data, format='json')
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
     
     def test_my_tickets(self):
@@ -274,9 +247,39 @@ class TicketAPITest(APITestCase):
             status='paid'
         )
         
-        response = self.client.get('/api/tickets/my_tickets/')
+        response = self.client.get(reverse('ticket-my-tickets'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(len(response.data['results']), 1)
+        
+        # Los filtros de TicketFilter también aplican aquí
+        response = self.client.get(
+            reverse('ticket-my-tickets'), {'event': self.event.id, 'status': 'used'}
+        )
+        self.assertEqual(response.data['count'], 0)
+    
+    def test_list_tickets_deferred_columns(self):
+        """Test el listado no dispara consultas por columnas diferidas"""
+        self.client.force_authenticate(user=self.user)
+        
+        for _ in range(3):
+            Ticket.objects.create(
+                ticket_type=self.ticket_type,
+                buyer=self.user,
+                original_price=Decimal('80000.00'),
+                final_price=Decimal('80000.00'),
+                status='paid'
+            )
+        
+        # COUNT de la paginación y listado con sus JOIN
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('ticket-list'))
+        
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertGreaterEqual(len(response.data), 1)
+        first = response.data['results'][0]
+        self.assertEqual(first['event_title'], self.event.title)
+        self.assertEqual(first['ticket_type_name'], self.ticket_type.name)
+        self.assertEqual(first['buyer_name'], self.user.username)
     
     def test_validate_discount_code(self):
         """Test validar código de descuento"""
@@ -297,6 +300,81 @@ class TicketAPITest(APITestCase):
             'ticket_type_id': self.ticket_type.id
         }
         
-        response = self.client.post('/api/discount-codes/verify/', data, format='json')
+        response = self.client.post(reverse('discountcode-verify'), data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertTrue(response.data['valid'])
\ No newline at end of file
+        self.assertTrue(response.data['valid'])
+    
+    def test_verify_discount_code_throttled(self):
+        """Test la verificación pública se limita a 10 peticiones por minuto"""
+        data = {'code': 'NOEXISTE', 'ticket_type_id': self.ticket_type.id}
+        
+        for _ in range(10):
+            response = self.client.post(reverse('discountcode-verify'), data, format='json')
+            self.assertNotEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        
+        response = self.client.post(reverse('discountcode-verify'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+    
+    def test_list_discount_codes_queries(self):
+        """Test el listado de códigos no hace una consulta por código"""
+        now = timezone.now()
+        
+        for code in ('PROMO10', 'PROMO20', 'PROMO30'):
+            discount = DiscountCode.objects.create(
+                code=code,
+                discount_type="fixed",
+                discount_value=Decimal('10000.00'),
+                event=self.event,
+                valid_from=now,
+                valid_until=now + timedelta(days=30),
+                is_active=True
+            )
+            discount.applicable_ticket_types.add(self.ticket_type)
+        
+        # COUNT de la paginación, listado con su evento y prefetch de tipos
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('discountcode-list'))
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertEqual(
+            response.data['results'][0]['applicable_ticket_types'],
+            [self.ticket_type.id]
+        )
+
+
+class OrjsonRendererTest(TestCase):
+    """Tests para el renderer JSON de la API (misma salida que JSONRenderer)"""
+    
+    def test_render_ticket_payload(self):
+        """Test Decimal como número y UUID como cadena"""
+        code = uuid.uuid4()
+        data = [{
+            'ticket_code': code,
+            'final_price': Decimal('80000.00'),
+            'status': 'paid'
+        }]
+        
+        rendered = OrjsonRenderer().render(data)
+        
+        self.assertIsInstance(rendered, bytes)
+        self.assertEqual(json.loads(rendered), [{
+            'ticket_code': str(code),
+            'final_price': 80000.0,
+            'status': 'paid'
+        }])
+    
+    def test_render_values_queryset(self):
+        """Test un QuerySet de values() se renderiza como lista"""
+        ticket_type = TicketTypeFactory(name="VIP", price=Decimal('150000.00'))
+        queryset = TicketType.objects.filter(pk=ticket_type.pk).values('name', 'price')
+        
+        rendered = OrjsonRenderer().render({'results': queryset})
+        
+        self.assertEqual(json.loads(rendered), {
+            'results': [{'name': 'VIP', 'price': 150000.0}]
+        })
+    
+    def test_render_none(self):
+        """Test respuesta vacía"""
+        self.assertEqual(OrjsonRenderer().render(None), b'')
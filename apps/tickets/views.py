@@ -2,11 +2,15 @@ from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
+from rest_framework.throttling import ScopedRateThrottle
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
 from django.db import transaction
-from django.core.mail import send_mail
-from django.conf import settings
+from django.db.models import (
+    F, Q, Case, When, BooleanField, Prefetch, Sum, Avg, Count
+)
+from django.db.models.functions import Greatest, Now
+from django.core.cache import cache
 
 from .models import TicketType, Ticket, DiscountCode
 from .serializers import (
@@ -14,7 +18,13 @@ from .serializers import (
     TicketPurchaseSerializer, DiscountCodeSerializer, TicketValidationSerializer
 )
 from .filters import TicketTypeFilter, TicketFilter
+from .signals import TICKET_TYPE_CACHE
 from config.permissions import IsEventStaffOrReadOnly, IsTicketOwner
+from config.utils.cache_utils import bump_cache_version, versioned_cache_key
+from config.utils.email_utils import EmailService
+
+TICKET_TYPE_CACHE_TIMEOUT = 60
+DISCOUNT_VERIFY_CACHE_TIMEOUT = 30
 
 
 class TicketTypeViewSet(viewsets.ModelViewSet):
@@ -27,7 +37,27 @@ class TicketTypeViewSet(viewsets.ModelViewSet):
     update: Actualizar tipo de ticket (solo organizador)
     destroy: Eliminar tipo de ticket (solo organizador)
     """
-    queryset = TicketType.objects.filter(is_active=True).select_related('event')
+    # La disponibilidad se calcula en SQL; las anotaciones usan los mismos
+    # nombres que las propiedades del modelo y las reemplazan en cada instancia
+    queryset = TicketType.objects.filter(is_active=True).select_related('event').annotate(
+        quantity_remaining=Greatest(F('quantity_available') - F('quantity_sold'), 0),
+        is_sold_out=Case(
+            When(quantity_sold__gte=F('quantity_available'), then=True),
+            default=False,
+            output_field=BooleanField()
+        ),
+        is_on_sale=Case(
+            When(
+                Q(is_active=True) &
+                Q(sale_start__lte=Now()) &
+                Q(sale_end__gte=Now()) &
+                Q(quantity_sold__lt=F('quantity_available')),
+                then=True
+            ),
+            default=False,
+            output_field=BooleanField()
+        )
+    )
     serializer_class = TicketTypeSerializer
     permission_classes = [IsEventStaffOrReadOnly]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -36,6 +66,18 @@ class TicketTypeViewSet(viewsets.ModelViewSet):
     ordering_fields = ['price', 'sale_start', 'display_order']
     ordering = ['display_order', 'price']
     
+    def list(self, request, *args, **kwargs):
+        """Catálogo servido desde caché; se invalida con cada venta vía signals"""
+        key = versioned_cache_key(TICKET_TYPE_CACHE, request.get_full_path())
+        data = cache.get(key)
+        if data is None:
+            response = super().list(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            data = response.data
+            cache.set(key, data, TICKET_TYPE_CACHE_TIMEOUT)
+        return Response(data)
+    
     @action(detail=False, methods=['get'])
     def available(self, request):
         """
@@ -43,18 +85,20 @@ class TicketTypeViewSet(viewsets.ModelViewSet):
         GET /api/ticket-types/available/
         """
         now = timezone.now()
-        tickets = self.get_queryset().filter(
-            is_active=True,
-            sale_start__lte=now,
-            sale_end__gte=now
-        ).exclude(
-            quantity_sold__gte=models.F('quantity_available')
-        )
+        tickets = self.get_queryset()
         
+        # Filtrar primero por evento para aprovechar tt_available_idx
         event_id = request.query_params.get('event')
         if event_id:
             tickets = tickets.filter(event_id=event_id)
         
+        tickets = tickets.filter(
+            is_active=True,
+            sale_start__lte=now,
+            sale_end__gte=now,
+            quantity_sold__lt=F('quantity_available')
+        )
+        
         serializer = self.get_serializer(tickets, many=True)
         return Response(serializer.data)
     
@@ -66,24 +110,28 @@ class TicketTypeViewSet(viewsets.ModelViewSet):
         """
         ticket_type = self.get_object()
         
-        total_tickets = Ticket.objects.filter(
+        # Una sola consulta con agregaciones condicionales
+        agg = Ticket.objects.filter(
             ticket_type=ticket_type,
             status__in=['paid', 'confirmed', 'used']
+        ).aggregate(
+            total_revenue=Sum('final_price'),
+            average_price=Avg('final_price'),
+            paid=Count('id', filter=Q(status='paid')),
+            confirmed=Count('id', filter=Q(status='confirmed')),
+            used=Count('id', filter=Q(status='used')),
         )
         
         stats = {
             'total_sold': ticket_type.quantity_sold,
-            'total_revenue': sum(t.final_price for t in total_tickets),
+            'total_revenue': agg['total_revenue'] or 0,
             'quantity_remaining': ticket_type.quantity_remaining,
             'is_sold_out': ticket_type.is_sold_out,
-            'average_price': (
-                sum(t.final_price for t in total_tickets) / len(total_tickets)
-                if total_tickets else 0
-            ),
+            'average_price': agg['average_price'] or 0,
             'sales_by_status': {
-                'paid': total_tickets.filter(status='paid').count(),
-                'confirmed': total_tickets.filter(status='confirmed').count(),
-                'used': total_tickets.filter(status='used').count(),
+                'paid': agg['paid'],
+                'confirmed': agg['confirmed'],
+                'used': agg['used'],
             }
         }
         
@@ -99,8 +147,10 @@ class TicketViewSet(viewsets.ModelViewSet):
     create: Comprar tickets
     update: Actualizar ticket (solo organizador)
     """
+    # TicketDetailSerializer recorre ticket_type -> event -> venue, buyer y
+    # attendee; cualquier atributo nuevo debe quedar dentro de estos JOIN
     queryset = Ticket.objects.all().select_related(
-        'ticket_type', 'ticket_type__event', 'buyer', 'attendee'
+        'ticket_type__event__venue', 'buyer', 'attendee'
     )
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -122,12 +172,17 @@ class TicketViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Personalizar queryset según el usuario"""
         user = self.request.user
+        queryset = self.queryset
+        
+        # Los listados solo necesitan las columnas de TicketListSerializer
+        if self.action in ('list', 'my_tickets'):
+            queryset = TicketListSerializer.setup_eager_loading(Ticket.objects.all())
         
         if user.is_staff:
-            return self.queryset
+            return queryset
         
         # Los usuarios ven solo sus tickets
-        return self.queryset.filter(buyer=user)
+        return queryset.filter(buyer=user)
     
     @action(detail=False, methods=['post'])
     @transaction.atomic
@@ -147,8 +202,10 @@ class TicketViewSet(viewsets.ModelViewSet):
         
         tickets = serializer.save()
         
-        # Enviar email de confirmación
-        self._send_purchase_confirmation(request.user, tickets)
+        # Enviar email de confirmación (tras el commit, en segundo plano)
+        self._send_purchase_confirmation(
+            request.user, tickets, total=serializer.total_price
+        )
         
         return Response(
             {
@@ -165,16 +222,13 @@ class TicketViewSet(viewsets.ModelViewSet):
         Endpoint personalizado: Mis tickets comprados
         GET /api/tickets/my_tickets/
         """
-        tickets = self.get_queryset()
+        # Filtros opcionales (?event=, ?status=, ...) vía TicketFilter
+        tickets = self.filter_queryset(self.get_queryset())
         
-        # Filtros opcionales
-        event_id = request.query_params.get('event')
-        if event_id:
-            tickets = tickets.filter(ticket_type__event_id=event_id)
-        
-        ticket_status = request.query_params.get('status')
-        if ticket_status:
-            tickets = tickets.filter(status=ticket_status)
+        page = self.paginate_queryset(tickets)
+        if page is not None:
+            serializer = TicketListSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
         
         serializer = TicketListSerializer(tickets, many=True)
         return Response(serializer.data)
@@ -204,16 +258,32 @@ class TicketViewSet(viewsets.ModelViewSet):
         
         reason = request.data.get('reason', '')
         
+        now = timezone.now()
+        
         with transaction.atomic():
-            ticket.status = 'cancelled'
-            ticket.cancelled_at = timezone.now()
-            ticket.cancellation_reason = reason
-            ticket.save()
+            # El filtro por estado evita devolver dos veces el mismo ticket
+            # si llegan cancelaciones concurrentes
+            updated = Ticket.objects.filter(pk=ticket.pk).exclude(
+                status__in=['cancelled', 'used']
+            ).update(
+                status='cancelled',
+                cancelled_at=now,
+                cancellation_reason=reason,
+                updated_at=now
+            )
+            if not updated:
+                return Response(
+                    {'error': 'Este ticket ya no se puede cancelar'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            # Devolver ticket al inventario (decremento atómico)
+            TicketType.objects.filter(pk=ticket.ticket_type_id).update(
+                quantity_sold=F('quantity_sold') - 1
+            )
             
-            # Devolver ticket al inventario
-            ticket_type = ticket.ticket_type
-            ticket_type.quantity_sold -= 1
-            ticket_type.save()
+            # update() no dispara signals: invalidar el catálogo al confirmar
+            transaction.on_commit(lambda: bump_cache_version(TICKET_TYPE_CACHE))
         
         return Response({
             'success': True,
@@ -230,8 +300,7 @@ class TicketViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        ticket_code = serializer.validated_data['ticket_code']
-        ticket = Ticket.objects.get(ticket_code=ticket_code)
+        ticket = serializer.validated_data['ticket']
         
         return Response({
             'valid': True,
@@ -261,9 +330,20 @@ class TicketViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        now = timezone.now()
+        updated = Ticket.objects.filter(pk=ticket.pk).exclude(status='used').update(
+            status='used',
+            used_at=now,
+            updated_at=now
+        )
+        if not updated:
+            return Response(
+                {'error': 'Este ticket ya fue usado'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
         ticket.status = 'used'
-        ticket.used_at = timezone.now()
-        ticket.save()
+        ticket.used_at = now
         
         return Response({
             'success': True,
@@ -271,8 +351,8 @@ class TicketViewSet(viewsets.ModelViewSet):
             'used_at': ticket.used_at
         })
     
-    def _send_purchase_confirmation(self, user, tickets):
-        """Enviar email de confirmación de compra"""
+    def _send_purchase_confirmation(self, user, tickets, total):
+        """Enviar email de confirmación de compra (total calculado en la compra)"""
         if not tickets:
             return
         
@@ -287,7 +367,7 @@ class TicketViewSet(viewsets.ModelViewSet):
         
         Evento: {event.title}
         Cantidad de tickets: {len(tickets)}
-        Total pagado: ${sum(t.final_price for t in tickets):,.2f}
+        Total pagado: ${total:,.2f}
         
         Tus códigos de ticket:
         {chr(10).join([f'- {t.ticket_code}' for t in tickets])}
@@ -295,17 +375,8 @@ class TicketViewSet(viewsets.ModelViewSet):
         ¡Nos vemos en el evento!
         """
         
-        try:
-            send_mail(
-                subject,
-                message,
-                settings.DEFAULT_FROM_EMAIL,
-                [user.email],
-                fail_silently=True,
-            )
-        except Exception as e:
-            # Log error pero no fallar la compra
-            print(f"Error enviando email: {e}")
+        # Se encola en Celery solo si la compra se confirma
+        EmailService.queue_email(subject, message, [user.email])
 
 
 class DiscountCodeViewSet(viewsets.ModelViewSet):
@@ -318,13 +389,21 @@ class DiscountCodeViewSet(viewsets.ModelViewSet):
     update: Actualizar código (solo organizador)
     destroy: Eliminar código (solo organizador)
     """
-    queryset = DiscountCode.objects.filter(is_active=True)
+    # applicable_ticket_types se serializa como lista de ids
+    queryset = DiscountCode.objects.filter(is_active=True).select_related(
+        'event'
+    ).prefetch_related(
+        Prefetch('applicable_ticket_types', queryset=TicketType.objects.only('id'))
+    )
     serializer_class = DiscountCodeSerializer
     permission_classes = [IsEventStaffOrReadOnly]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['code', 'description']
     ordering_fields = ['valid_from', 'discount_value', 'times_used']
     ordering = ['-created_at']
+    # Alcance de ScopedRateThrottle; la acción verify lo fija a
+    # 'discount_verify' (as_view() solo acepta atributos ya declarados)
+    throttle_scope = None
     
     def get_permissions(self):
         """Allow unauthenticated access to verify action"""
@@ -333,15 +412,20 @@ class DiscountCodeViewSet(viewsets.ModelViewSet):
             return [AllowAny()]
         return super().get_permissions()
     
-    @action(detail=False, methods=['post'])
+    def get_throttles(self):
+        """Limitar la verificación pública para frenar la enumeración de códigos"""
+        if self.action == 'verify':
+            return [ScopedRateThrottle()]
+        return super().get_throttles()
+    
+    @action(detail=False, methods=['post'], throttle_scope='discount_verify')
     def verify(self, request):
-
         """
         Endpoint personalizado: Verificar validez de un código de descuento
         POST /api/discount-codes/verify/
         Body: {"code": "EARLYBIRD", "ticket_type_id": 1}
         """
-        code = request.data.get('code', '').upper()
+        code = request.data.get('code', '').strip().upper()
         ticket_type_id = request.data.get('ticket_type_id')
         
         if not code:
@@ -350,36 +434,46 @@ class DiscountCodeViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        # Se guarda solo el payload de la respuesta, nunca instancias
+        key = f'disc:{code}:{ticket_type_id or 0}'
+        payload = cache.get(key)
+        if payload is None:
+            payload = self._verify_payload(code, ticket_type_id)
+            cache.set(key, payload, DISCOUNT_VERIFY_CACHE_TIMEOUT)
+        
+        return Response(payload)
+    
+    def _verify_payload(self, code, ticket_type_id):
+        """Resultado de verificar un código para un tipo de ticket"""
         try:
-            discount = DiscountCode.objects.get(code=code, is_active=True)
-            
-            if not discount.is_valid:
-                return Response({
-                    'valid': False,
-                    'error': 'Código no válido o expirado'
-                })
-            
-            # Verificar si aplica para el ticket type
-            if ticket_type_id and discount.applicable_ticket_types.exists():
-                from .models import TicketType
-                ticket_type = TicketType.objects.get(id=ticket_type_id)
-                
-                if not discount.applicable_ticket_types.filter(id=ticket_type_id).exists():
-                    return Response({
-                        'valid': False,
-                        'error': 'Este código no aplica para este tipo de ticket'
-                    })
-            
-            return Response({
-                'valid': True,
-                'discount': DiscountCodeSerializer(discount).data
-            })
-            
+            # El queryset ya precarga los ids de applicable_ticket_types
+            discount = self.get_queryset().get(code=code)
         except DiscountCode.DoesNotExist:
-            return Response({
+            return {
                 'valid': False,
                 'error': 'Código no encontrado'
-            })
+            }
+        
+        if not discount.is_valid:
+            return {
+                'valid': False,
+                'error': 'Código no válido o expirado'
+            }
+        
+        # Verificar si aplica para el ticket type (sin tipos = aplica a todos)
+        applicable_ids = {
+            str(ticket_type.pk) for ticket_type in discount.applicable_ticket_types.all()
+        }
+        if ticket_type_id and applicable_ids and str(ticket_type_id) not in applicable_ids:
+            return {
+                'valid': False,
+                'error': 'Este código no aplica para este tipo de ticket'
+            }
+        
+        return {
+            'valid': True,
+            'discount': DiscountCodeSerializer(discount).data
+        }
     
     @action(detail=True, methods=['get'])
     def usage_stats(self, request, pk=None):
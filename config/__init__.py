@@ -1,2 +1,4 @@
-import pymysql
-pymysql.install_as_MySQLdb()
\ No newline at end of file
+# Cargar la app de Celery al arrancar Django para que @shared_task la use
+from .celery import app as celery_app
+
+__all__ = ('celery_app',)
@@ -0,0 +1,80 @@
+"""
+Documentación de la API (Swagger / ReDoc)
+Ubicación: config/api_docs.py
+
+drf-yasg se importa la primera vez que se pide la documentación y no al
+arrancar cada worker: recorre todas las vistas y serializers y alarga el
+arranque sin que la API lo necesite.
+"""
+
+import functools
+
+from django.conf import settings
+
+# El esquema OpenAPI se genera por introspección de todas las vistas; en
+# producción se cachea 15 minutos (en desarrollo se regenera siempre)
+SCHEMA_CACHE_TIMEOUT = 0 if settings.DEBUG else 60 * 15
+
+API_DESCRIPTION = """
+        # EventHub - Sistema de Gestión de Eventos
+        
+        API RESTful profesional para gestión de eventos, tickets, asistentes y patrocinadores.
+        
+        ## Características:
+        - 🎉 Gestión completa de eventos
+        - 🎫 Sistema de tickets y descuentos
+        - 👥 Registro de asistentes
+        - 💼 Gestión de patrocinadores
+        - 🔐 Autenticación JWT
+        
+        ## Autenticación:
+        Para usar endpoints protegidos, incluye el header:
+        ```
+        Authorization: Bearer {tu_token}
+        ```
+        
+        Obtén tu token en `/api/token/`
+        """
+
+
+@functools.lru_cache(maxsize=1)
+def _schema_view():
+    """Construye la vista de esquema de drf-yasg (una vez por proceso)"""
+    from drf_yasg import openapi
+    from drf_yasg.views import get_schema_view
+    from rest_framework import permissions
+    
+    return get_schema_view(
+        openapi.Info(
+            title="EventHub API",
+            default_version='v1',
+            description=API_DESCRIPTION,
+            terms_of_service="https://www.eventhub.com/terms/",
+            contact=openapi.Contact(email="contact@eventhub.com"),
+            license=openapi.License(name="MIT License"),
+        ),
+        public=True,
+        permission_classes=[permissions.AllowAny],
+        authentication_classes=[],
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _docs_view(renderer):
+    """Vista cacheada para 'swagger', 'redoc' o el esquema JSON ('json')"""
+    schema_view = _schema_view()
+    if renderer == 'json':
+        return schema_view.without_ui(cache_timeout=SCHEMA_CACHE_TIMEOUT)
+    return schema_view.with_ui(renderer, cache_timeout=SCHEMA_CACHE_TIMEOUT)
+
+
+def swagger_ui(request, *args, **kwargs):
+    return _docs_view('swagger')(request, *args, **kwargs)
+
+
+def redoc_ui(request, *args, **kwargs):
+    return _docs_view('redoc')(request, *args, **kwargs)
+
+
+def schema_json(request, *args, **kwargs):
+    return _docs_view('json')(request, *args, **kwargs)
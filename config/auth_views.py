@@ -9,6 +9,8 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from django.contrib.auth.models import User
 from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from rest_framework_simplejwt.tokens import RefreshToken
 from config.utils.email_utils import EmailService
 import logging
@@ -33,34 +35,42 @@ def register_user(request):
                     status=status.HTTP_400_BAD_REQUEST
                 )
         
-        # Validar que el username no exista
-        if User.objects.filter(username=request.data['username']).exists():
-            return Response(
-                {'error': 'Este nombre de usuario ya está en uso'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        username = request.data['username']
+        email = request.data['email']
         
-        # Validar que el email no exista
-        if User.objects.filter(email=request.data['email']).exists():
+        # Validar username y email en una sola consulta
+        clash = User.objects.filter(
+            Q(username=username) | Q(email=email)
+        ).values('username', 'email').first()
+        if clash:
+            if clash['username'] == username:
+                return Response(
+                    {'error': 'Este nombre de usuario ya está en uso'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
             return Response(
                 {'error': 'Este email ya está registrado'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Crear usuario
-        user = User.objects.create(
-            username=request.data['username'],
-            email=request.data['email'],
-            first_name=request.data['first_name'],
-            last_name=request.data['last_name'],
-            password=make_password(request.data['password'])
-        )
-        
-        # Enviar email de bienvenida
+        # Crear usuario (la restricción única cubre registros concurrentes)
         try:
-            EmailService.send_welcome_email(user)
-        except Exception as e:
-            logger.error(f"Error enviando email de bienvenida: {str(e)}")
+            with transaction.atomic():
+                user = User.objects.create(
+                    username=username,
+                    email=email,
+                    first_name=request.data['first_name'],
+                    last_name=request.data['last_name'],
+                    password=make_password(request.data['password'])
+                )
+                
+                # Email de bienvenida encolado en Celery tras el commit
+                EmailService.send_welcome_email(user)
+        except IntegrityError:
+            return Response(
+                {'error': 'Este nombre de usuario ya está en uso'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         # Generar tokens JWT
         refresh = RefreshToken.for_user(user)
@@ -119,15 +129,20 @@ def update_profile(request):
     
     # Actualizar campos permitidos
     allowed_fields = ['first_name', 'last_name', 'email']
+    update_fields = []
     for field in allowed_fields:
         if field in request.data:
             setattr(user, field, request.data[field])
+            update_fields.append(field)
     
     # Cambiar contraseña si se proporciona
     if 'password' in request.data:
         user.password = make_password(request.data['password'])
+        update_fields.append('password')
     
-    user.save()
+    # Solo se escriben las columnas modificadas
+    if update_fields:
+        user.save(update_fields=update_fields)
     
     return Response({
         'message': 'Perfil actualizado exitosamente',
@@ -0,0 +1,20 @@
+"""
+Aplicación Celery de EventHub
+Ubicación: config/celery.py
+
+Worker: celery -A config worker -l info
+En local: DJANGO_SETTINGS_MODULE=config.settings.dev celery -A config worker -l info
+"""
+
+import os
+
+from celery import Celery
+
+# Un worker sin DJANGO_SETTINGS_MODULE arranca con producción, nunca con dev
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.prod')
+
+app = Celery('eventhub')
+
+# Toda la configuración se lee de settings con el prefijo CELERY_
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
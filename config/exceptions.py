@@ -1,11 +1,33 @@
 from rest_framework.views import exception_handler
-from rest_framework.exceptions import ValidationError, NotFound, PermissionDenied
+from rest_framework.exceptions import (
+    ValidationError, NotFound, PermissionDenied, AuthenticationFailed,
+    NotAuthenticated, MethodNotAllowed, ParseError, Throttled
+)
 from django.http import Http404
 from django.core.exceptions import ObjectDoesNotExist
+from django.core.exceptions import PermissionDenied as DjangoPermissionDenied
 import logging
 
 logger = logging.getLogger('apps')
 
+# Mensajes por clase de excepción (se construye una sola vez al importar);
+# las claves son las clases, no sus nombres, para evitar colisiones
+ERROR_MESSAGES = {
+    ValidationError: 'Error de validación en los datos proporcionados',
+    NotFound: 'El recurso solicitado no fue encontrado',
+    PermissionDenied: 'No tienes permisos para realizar esta acción',
+    DjangoPermissionDenied: 'No tienes permisos para realizar esta acción',
+    AuthenticationFailed: 'Credenciales de autenticación inválidas',
+    NotAuthenticated: 'Debes iniciar sesión para acceder a este recurso',
+    MethodNotAllowed: 'Método HTTP no permitido para este endpoint',
+    ParseError: 'Error al procesar los datos enviados',
+    Throttled: 'Demasiadas solicitudes. Intenta más tarde',
+}
+DEFAULT_ERROR_MESSAGE = 'Ha ocurrido un error en el servidor'
+
+# Mensaje ya resuelto por tipo concreto (incluye subclases)
+_RESOLVED_MESSAGES = {}
+
 
 def custom_exception_handler(exc, context):
     """
@@ -15,7 +37,7 @@ def custom_exception_handler(exc, context):
     response = exception_handler(exc, context)
 
     # Log the exception
-    logger.error(f"Exception occurred: {exc.__class__.__name__} - {str(exc)}")
+    logger.error("Exception occurred: %s - %s", exc.__class__.__name__, exc)
 
     if response is not None:
         # Standardize error response format
@@ -53,16 +75,16 @@ def get_error_message(exc):
     """
     Generate user-friendly error messages
     """
-    error_messages = {
-        'ValidationError': 'Error de validación en los datos proporcionados',
-        'NotFound': 'El recurso solicitado no fue encontrado',
-        'PermissionDenied': 'No tienes permisos para realizar esta acción',
-        'AuthenticationFailed': 'Credenciales de autenticación inválidas',
-        'NotAuthenticated': 'Debes iniciar sesión para acceder a este recurso',
-        'MethodNotAllowed': 'Método HTTP no permitido para este endpoint',
-        'ParseError': 'Error al procesar los datos enviados',
-        'Throttled': 'Demasiadas solicitudes. Intenta más tarde',
-    }
+    exc_type = type(exc)
+    try:
+        return _RESOLVED_MESSAGES[exc_type]
+    except KeyError:
+        pass
     
-    exc_class = exc.__class__.__name__
-    return error_messages.get(exc_class, 'Ha ocurrido un error en el servidor')
\ No newline at end of file
+    # Primera vez que aparece este tipo: buscar la clase más cercana en su MRO
+    message = next(
+        (ERROR_MESSAGES[cls] for cls in exc_type.__mro__ if cls in ERROR_MESSAGES),
+        DEFAULT_ERROR_MESSAGE
+    )
+    _RESOLVED_MESSAGES[exc_type] = message
+    return message
\ No newline at end of file
@@ -0,0 +1,58 @@
+from functools import partial
+import hashlib
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator que guarda en caché el COUNT(*) de cada consulta filtrada
+    """
+    cache_timeout = 60 * 5
+
+    def __init__(self, *args, refresh_count=False, **kwargs):
+        self.refresh_count = refresh_count
+        super().__init__(*args, **kwargs)
+
+    def _count_cache_key(self):
+        try:
+            sql = str(self.object_list.query)
+        except (AttributeError, EmptyResultSet):
+            return None
+        return 'paginator:count:' + hashlib.md5(sql.encode()).hexdigest()
+
+    @cached_property
+    def count(self):
+        key = self._count_cache_key()
+        if key is None:
+            return super().count
+
+        if not self.refresh_count:
+            count = cache.get(key)
+            if count is not None:
+                return count
+
+        count = self.object_list.count()
+        cache.set(key, count, self.cache_timeout)
+        return count
+
+
+class CachedCountPagination(PageNumberPagination):
+    """
+    Paginación por número de página con total cacheado
+
+    La primera página siempre recalcula el total y refresca la caché; las
+    siguientes reutilizan el valor guardado para la misma consulta SQL.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_number = request.query_params.get(self.page_query_param, '1')
+        self.django_paginator_class = partial(
+            CachedCountPaginator,
+            refresh_count=page_number == '1'
+        )
+        return super().paginate_queryset(queryset, request, view)
@@ -1,35 +1,86 @@
+import functools
+
 from rest_framework import permissions
 
+# Marca de "atributo inexistente": getattr con valor por defecto evita el
+# try/except interno de hasattr y la doble resolución del atributo
+_SENTINEL = object()
+
+# Métodos de solo lectura como frozenset: pertenencia O(1) en cada petición
+_SAFE_METHODS = frozenset(permissions.SAFE_METHODS)
+
+# Atributos que identifican al propietario, en orden de prioridad
+OWNER_ATTRS = ('organizer', 'user', 'buyer', 'created_by')
+OWNER_ATTRS_PATHS = tuple((attr,) for attr in OWNER_ATTRS)
+
+# Rutas de atributos ya resueltas por clase de modelo: la respuesta es la
+# misma para todas las instancias, así que solo se sondea la primera vez
+OWNER_FIELDS = {}
+ORGANIZER_PATHS = (('organizer',), ('event', 'organizer'))
+_ORGANIZER_FIELDS = {}
+
+
+def _resolve_path(obj, candidates, registry):
+    """
+    Devuelve la primera ruta de `candidates` que existe en `obj` (o None),
+    cacheada por tipo en `registry`
+    """
+    cls = type(obj)
+    try:
+        return registry[cls]
+    except KeyError:
+        pass
+    
+    path = None
+    for candidate in candidates:
+        if getattr(cls, candidate[0], _SENTINEL) is not _SENTINEL:
+            path = candidate
+            break
+    registry[cls] = path
+    return path
+
+
+def _get_path(obj, path):
+    """Sigue una ruta de atributos (p. ej. ('event', 'organizer')); None si se corta"""
+    return functools.reduce(lambda value, attr: getattr(value, attr, None), path, obj)
+
 
-class IsOwnerOrReadOnly(permissions.BasePermission):
+class _BasePermission(permissions.BasePermission):
+    """
+    Base de los permisos del proyecto: guarda en la petición los datos del
+    usuario que se consultan varias veces en la cadena de permisos
+    """
+    @staticmethod
+    def _user_is_staff(request):
+        cache = request.__dict__.setdefault('_perm_cache', {})
+        if 'is_staff' not in cache:
+            cache['is_staff'] = bool(request.user and request.user.is_staff)
+        return cache['is_staff']
+
+
+class IsOwnerOrReadOnly(_BasePermission):
     """
     Permiso personalizado para permitir solo a los propietarios editar objetos
     """
     def has_object_permission(self, request, view, obj):
         # Permisos de lectura para cualquiera
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in _SAFE_METHODS:
             return True
         
         # Permisos de escritura solo para el propietario
-        if hasattr(obj, 'organizer'):
-            return obj.organizer == request.user
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
-        if hasattr(obj, 'buyer'):
-            return obj.buyer == request.user
-        if hasattr(obj, 'created_by'):
-            return obj.created_by == request.user
-        
-        return False
+        path = _resolve_path(obj, OWNER_ATTRS_PATHS, OWNER_FIELDS)
+        if path is None:
+            return False
+        return _get_path(obj, path) == request.user
 
 
-class IsOrganizerOrReadOnly(permissions.BasePermission):
+class IsOrganizerOrReadOnly(_BasePermission):
     """
     Permiso para organizadores de eventos
     """
     def has_permission(self, request, view):
         # Lectura para todos
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in _SAFE_METHODS:
             return True
         
         # Escritura solo para usuarios autenticados
@@ -37,59 +88,56 @@ class IsOrganizerOrReadOnly(permissions.BasePermission):
     
     def has_object_permission(self, request, view, obj):
         # Lectura para todos
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in _SAFE_METHODS:
             return True
         
         # Determinar el organizador según el tipo de objeto
-        if hasattr(obj, 'organizer'):
-            return obj.organizer == request.user or request.user.is_staff
-        elif hasattr(obj, 'event') and hasattr(obj.event, 'organizer'):
-            return obj.event.organizer == request.user or request.user.is_staff
+        path = _resolve_path(obj, ORGANIZER_PATHS, _ORGANIZER_FIELDS)
+        if path is not None:
+            return _get_path(obj, path) == request.user or self._user_is_staff(request)
         
-        return request.user.is_staff
+        return self._user_is_staff(request)
 
 
-class IsAdminOrReadOnly(permissions.BasePermission):
+class IsAdminOrReadOnly(_BasePermission):
     """
     Permiso solo para administradores (escritura)
     Lectura para todos
     """
     def has_permission(self, request, view):
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in _SAFE_METHODS:
             return True
-        return request.user and request.user.is_staff
+        return self._user_is_staff(request)
 
 
-class IsEventStaffOrReadOnly(permissions.BasePermission):
+class IsEventStaffOrReadOnly(_BasePermission):
     """
     Permiso para staff de eventos (organizador o admin)
     """
     def has_permission(self, request, view):
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in _SAFE_METHODS:
             return True
         return request.user and request.user.is_authenticated
     
     def has_object_permission(self, request, view, obj):
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in _SAFE_METHODS:
             return True
         
         # Verificar si es organizador del evento relacionado
-        event = None
-        if hasattr(obj, 'event'):
-            event = obj.event
-        elif hasattr(obj, 'ticket_type') and hasattr(obj.ticket_type, 'event'):
-            event = obj.ticket_type.event
+        event = getattr(obj, 'event', _SENTINEL)
+        if event is _SENTINEL:
+            event = getattr(getattr(obj, 'ticket_type', None), 'event', None)
         
         if event:
             return (
                 event.organizer == request.user or
-                request.user.is_staff
+                self._user_is_staff(request)
             )
         
-        return request.user.is_staff
+        return self._user_is_staff(request)
 
 
-class CanCheckIn(permissions.BasePermission):
+class CanCheckIn(_BasePermission):
     """
     Permiso para realizar check-in de asistentes
     """
@@ -99,62 +147,66 @@ class CanCheckIn(permissions.BasePermission):
     
     def has_object_permission(self, request, view, obj):
         # Staff siempre puede
-        if request.user.is_staff:
+        if self._user_is_staff(request):
             return True
         
         # Organizador del evento puede
-        if hasattr(obj, 'event'):
-            return obj.event.organizer == request.user
+        event = getattr(obj, 'event', _SENTINEL)
+        if event is not _SENTINEL:
+            return event.organizer == request.user
         
         return False
 
 
-class IsSponsorManagerOrReadOnly(permissions.BasePermission):
+class IsSponsorManagerOrReadOnly(_BasePermission):
     """
     Permiso para gestores de patrocinadores
     """
     def has_permission(self, request, view):
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in _SAFE_METHODS:
             return True
         return request.user and request.user.is_authenticated
     
     def has_object_permission(self, request, view, obj):
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in _SAFE_METHODS:
             return True
         
         # Staff siempre puede
-        if request.user.is_staff:
+        if self._user_is_staff(request):
             return True
         
         # Account manager puede editar su sponsor
-        if hasattr(obj, 'account_manager'):
-            return obj.account_manager == request.user
+        account_manager = getattr(obj, 'account_manager', _SENTINEL)
+        if account_manager is not _SENTINEL:
+            return account_manager == request.user
         
         # Para sponsorships, verificar el event organizer
-        if hasattr(obj, 'event'):
-            return obj.event.organizer == request.user
+        event = getattr(obj, 'event', _SENTINEL)
+        if event is not _SENTINEL:
+            return event.organizer == request.user
         
         return False
 
 
-class IsTicketOwner(permissions.BasePermission):
+class IsTicketOwner(_BasePermission):
     """
     Permiso para propietarios de tickets
     """
     def has_object_permission(self, request, view, obj):
         # El comprador puede ver su ticket
-        if hasattr(obj, 'buyer'):
-            return obj.buyer == request.user
+        buyer = getattr(obj, 'buyer', _SENTINEL)
+        if buyer is not _SENTINEL:
+            return buyer == request.user
         
         # El organizador del evento puede ver todos los tickets
-        if hasattr(obj, 'ticket_type') and hasattr(obj.ticket_type, 'event'):
-            event = obj.ticket_type.event
-            return event.organizer == request.user or request.user.is_staff
+        event = getattr(getattr(obj, 'ticket_type', None), 'event', _SENTINEL)
+        if event is not _SENTINEL:
+            return event.organizer == request.user or self._user_is_staff(request)
         
-        return request.user.is_staff
+        return self._user_is_staff(request)
 
 
-class CanManageSurvey(permissions.BasePermission):
+class CanManageSurvey(_BasePermission):
     """
     Permiso para gestionar encuestas
     """
@@ -163,22 +215,25 @@ class CanManageSurvey(permissions.BasePermission):
     
     def has_object_permission(self, request, view, obj):
         # Staff siempre puede
-        if request.user.is_staff:
+        if self._user_is_staff(request):
             return True
         
         # Creador de la encuesta puede
-        if hasattr(obj, 'created_by'):
-            return obj.created_by == request.user
+        created_by = getattr(obj, 'created_by', _SENTINEL)
+        if created_by is not _SENTINEL:
+            return created_by == request.user
         
         # Organizador del evento puede
-        if hasattr(obj, 'event'):
-            return obj.event.organizer == request.user
+        event = getattr(obj, 'event', _SENTINEL)
+        if event is not _SENTINEL:
+            return event.organizer == request.user
         
         # Para respuestas, verificar la encuesta
-        if hasattr(obj, 'survey'):
+        survey = getattr(obj, 'survey', _SENTINEL)
+        if survey is not _SENTINEL:
             return (
-                obj.survey.created_by == request.user or
-                obj.survey.event.organizer == request.user
+                survey.created_by == request.user or
+                survey.event.organizer == request.user
             )
         
         return False
\ No newline at end of file
@@ -0,0 +1,33 @@
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class OrjsonRenderer(BaseRenderer):
+    """
+    Renderer JSON basado en orjson
+
+    Escribe directamente a bytes; los tipos que orjson no conoce (QuerySet,
+    Decimal, cadenas perezosas, fechas...) se delegan en el encoder de DRF,
+    así la salida es la misma que con JSONRenderer (QuerySet como lista,
+    Decimal como número).
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+    # Las fechas también pasan por el encoder de DRF (ISO con 'Z' y milisegundos)
+    options = orjson.OPT_PASSTHROUGH_DATETIME
+
+    # Un encoder compartido: default() no guarda estado
+    encoder_default = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        options = self.options
+        # La API navegable pide salida indentada
+        if renderer_context and renderer_context.get('indent'):
+            options |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=self.encoder_default, option=options)
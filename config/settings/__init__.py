@@ -1,12 +1,7 @@
-from decouple import config
+"""
+Settings de EventHub
 
-# Determine which settings to use based on DEBUG environment variable
-DEBUG = config('DEBUG', default=True, cast=bool)
-
-if DEBUG:
-    from .dev import *
-else:
-    from .prod import *
-
-import pymysql
-pymysql.install_as_MySQLdb()
\ No newline at end of file
+Se elige el módulo con DJANGO_SETTINGS_MODULE:
+- config.settings.dev (por defecto en manage.py)
+- config.settings.prod (producción; por defecto en wsgi/asgi y Celery)
+"""
@@ -2,6 +2,13 @@ from pathlib import Path
 from decouple import config
 from datetime import timedelta
 
+# El motor por defecto (mysql.connector.django) no usa MySQLdb; PyMySQL solo
+# se instala como MySQLdb si se pide explícitamente (django.db.backends.mysql
+# sin mysqlclient)
+if config('USE_PYMYSQL', default=False, cast=bool):
+    import pymysql
+    pymysql.install_as_MySQLdb()
+
 # Build paths inside the project
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -37,6 +44,8 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Estáticos servidos por WhiteNoise antes del resto de middleware
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -108,10 +117,17 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'config.renderers.OrjsonRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
+    # Solo afecta a los DecimalField de los serializers: llegan a orjson ya
+    # como str. Un Decimal suelto en un dict de Response pasa por el encoder
+    # de DRF y sale como número
+    'COERCE_DECIMAL_TO_STRING': True,
     'EXCEPTION_HANDLER': 'config.exceptions.custom_exception_handler',
+    'DEFAULT_THROTTLE_RATES': {
+        'discount_verify': '10/min',
+    },
 }
 
 # JWT Configuration
@@ -140,6 +156,14 @@ EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='noreply@eventhub.com')
 
+# Celery Configuration (cola de tareas en segundo plano)
+CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='redis://localhost:6379/0')
+CELERY_TASK_ALWAYS_EAGER = config('CELERY_TASK_ALWAYS_EAGER', default=False, cast=bool)
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['json']
+CELERY_TIMEZONE = TIME_ZONE
+CELERY_IMPORTS = ('config.tasks',)
+
 # Logging Configuration
 LOGGING = {
     'version': 1,
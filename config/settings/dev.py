@@ -15,6 +15,9 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD', default=''),
         'HOST': config('DB_HOST', default='localhost'),
         'PORT': config('DB_PORT', default='3306'),
+        # Conexiones persistentes: evita el handshake (TCP/TLS) en cada petición
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
             'charset': 'utf8mb4',
@@ -36,6 +39,12 @@ CACHES = {
     }
 }
 
+# Celery: ejecutar las tareas en el mismo proceso (sin broker)
+CELERY_TASK_ALWAYS_EAGER = True
+
+# WhiteNoise sirve los estáticos directamente desde las apps (sin collectstatic)
+WHITENOISE_USE_FINDERS = True
+
 # Security settings for development
 CSRF_COOKIE_SECURE = False
 SESSION_COOKIE_SECURE = False
@@ -19,6 +19,9 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD'),
         'HOST': config('DB_HOST'),
         'PORT': config('DB_PORT', default='3306'),
+        # Conexiones persistentes: evita el handshake (TCP/TLS) en cada petición
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
             'charset': 'utf8mb4',
@@ -58,12 +61,33 @@ if REDIS_URL:
             'LOCATION': REDIS_URL,
             'OPTIONS': {
                 'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+                'CONNECTION_POOL_KWARGS': {
+                    'max_connections': config('REDIS_MAX_CONNECTIONS', default=100, cast=int),
+                },
+                # Protocolo pickle 5: más rápido y compacto que el de por defecto
+                'PICKLE_VERSION': 5,
+                'SOCKET_CONNECT_TIMEOUT': 2,
+                'SOCKET_TIMEOUT': 2,
             }
         }
     }
 
-# Static files handling for production
-STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage'
+# Celery usa el mismo Redis como broker; sin Redis las tareas se ejecutan
+# en el proceso web para no perder emails
+CELERY_BROKER_URL = config('CELERY_BROKER_URL', default=REDIS_URL or CELERY_BROKER_URL)
+CELERY_TASK_ALWAYS_EAGER = config('CELERY_TASK_ALWAYS_EAGER', default=not REDIS_URL, cast=bool)
+
+# Static files handling for production: WhiteNoise sirve los ficheros con
+# hash (manifest) y sus versiones comprimidas. Django 5.1 ya no lee
+# STATICFILES_STORAGE, solo STORAGES
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
 
 # Logging for production
 LOGGING['handlers']['file']['filename'] = '/tmp/eventhub.log'
\ No newline at end of file
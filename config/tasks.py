@@ -0,0 +1,16 @@
+"""
+Tareas asíncronas de EventHub
+Ubicación: config/tasks.py
+"""
+
+from celery import shared_task
+
+from config.utils.email_utils import EmailService
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def send_email_task(self, subject, message, recipient_list, html_message=None):
+    """Envía un email fuera del ciclo de la petición; reintenta si falla el SMTP"""
+    if not EmailService.send_email(subject, message, recipient_list, html_message):
+        raise self.retry()
+    return True
@@ -2,50 +2,14 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from rest_framework import permissions
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
     TokenVerifyView
 )
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
 from .views import health_check
 from .auth_views import register_user, get_current_user, update_profile
-
-# Configuración de Swagger
-schema_view = get_schema_view(
-    openapi.Info(
-        title="EventHub API",
-        default_version='v1',
-        description="""
-        # EventHub - Sistema de Gestión de Eventos
-        
-        API RESTful profesional para gestión de eventos, tickets, asistentes y patrocinadores.
-        
-        ## Características:
-        - 🎉 Gestión completa de eventos
-        - 🎫 Sistema de tickets y descuentos
-        - 👥 Registro de asistentes
-        - 💼 Gestión de patrocinadores
-        - 🔐 Autenticación JWT
-        
-        ## Autenticación:
-        Para usar endpoints protegidos, incluye el header:
-        ```
-        Authorization: Bearer {tu_token}
-        ```
-        
-        Obtén tu token en `/api/token/`
-        """,
-        terms_of_service="https://www.eventhub.com/terms/",
-        contact=openapi.Contact(email="contact@eventhub.com"),
-        license=openapi.License(name="MIT License"),
-    ),
-    public=True,
-    permission_classes=[permissions.AllowAny],
-    authentication_classes=[],
-)
+from .api_docs import swagger_ui, redoc_ui, schema_json
 
 urlpatterns = [
     # Admin
@@ -71,12 +35,11 @@ urlpatterns = [
     path('api/sponsors/', include('apps.sponsors.urls')),
     
     # Documentación API
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
-    path('swagger.json', schema_view.without_ui(cache_timeout=0), name='schema-json'),
+    path('swagger/', swagger_ui, name='schema-swagger-ui'),
+    path('redoc/', redoc_ui, name='schema-redoc'),
+    path('swagger.json', schema_json, name='schema-json'),
 ]
 
-# Servir archivos media en desarrollo
+# Servir archivos media en desarrollo (los estáticos los sirve WhiteNoise)
 if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
\ No newline at end of file
+    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
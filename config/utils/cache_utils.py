@@ -0,0 +1,33 @@
+"""
+Utilidades de caché versionada para EventHub
+Ubicación: config/utils/cache_utils.py
+"""
+
+import uuid
+
+from django.core.cache import cache
+
+
+def _version_key(namespace):
+    return f'{namespace}:version'
+
+
+def get_cache_version(namespace):
+    """Versión actual de un espacio de caché (se crea si no existe)"""
+    return cache.get_or_set(_version_key(namespace), uuid.uuid4().hex, None)
+
+
+def bump_cache_version(namespace):
+    """
+    Invalida todas las entradas de un espacio de caché
+
+    Se cambia la versión en lugar de borrar claves por patrón, lo que
+    funciona igual con LocMemCache y con Redis.
+    """
+    cache.set(_version_key(namespace), uuid.uuid4().hex, None)
+
+
+def versioned_cache_key(namespace, *parts):
+    """Construye una clave ligada a la versión vigente del espacio"""
+    suffix = ':'.join(str(part) for part in parts)
+    return f'{namespace}:{get_cache_version(namespace)}:{suffix}'
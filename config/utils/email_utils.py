@@ -3,10 +3,11 @@ Sistema de envío de emails para EventHub
 Ubicación: config/utils/email_utils.py
 """
 
-from django.core.mail import send_mail, EmailMultiAlternatives
+from django.core.mail import send_mail, get_connection, EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.conf import settings
-from django.utils.html import strip_tags
+from django.db import transaction
+from django.db.models import QuerySet
 import logging
 
 logger = logging.getLogger('apps')
@@ -35,58 +36,44 @@ class EmailService:
                 html_message=html_message,
                 fail_silently=False,
             )
-            logger.info(f"Email enviado a {recipient_list}")
+            logger.info("Email enviado a %s", recipient_list)
             return True
         except Exception as e:
-            logger.error(f"Error enviando email: {str(e)}")
+            logger.error("Error enviando email: %s", e)
             return False
     
     @staticmethod
-    def send_welcome_email(user):
-        """Envía email de bienvenida"""
-        subject = '¡Bienvenido a EventHub! 🎉'
-        message = f"""
-        Hola {user.first_name or user.username},
-        
-        ¡Bienvenido a EventHub!
-        
-        Tu cuenta ha sido creada exitosamente. Ahora puedes:
-        - Explorar eventos increíbles
-        - Comprar tickets
-        - Gestionar tus asistencias
-        - Y mucho más!
+    def queue_email(subject, message, recipient_list, html_message=None):
+        """
+        Encola un email en Celery cuando la transacción actual se confirme
         
-        ¡Gracias por unirte a nosotros!
+        La petición no espera al SMTP y no se envía nada si hay rollback.
+        """
+        from config.tasks import send_email_task
         
-        Equipo EventHub
+        transaction.on_commit(
+            lambda: send_email_task.delay(subject, message, recipient_list, html_message)
+        )
+    
+    @staticmethod
+    def render_email(template_name, context):
         """
+        Renderiza las versiones texto y HTML de un email
         
-        html_message = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                    <h1 style="color: #6366f1;">¡Bienvenido a EventHub! 🎉</h1>
-                    <p>Hola <strong>{user.first_name or user.username}</strong>,</p>
-                    <p>¡Tu cuenta ha sido creada exitosamente!</p>
-                    
-                    <div style="background: #f3f4f6; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                        <h3 style="margin-top: 0;">Ahora puedes:</h3>
-                        <ul>
-                            <li>✨ Explorar eventos increíbles</li>
-                            <li>🎫 Comprar tickets</li>
-                            <li>📋 Gestionar tus asistencias</li>
-                            <li>🎉 Y mucho más!</li>
-                        </ul>
-                    </div>
-                    
-                    <p>¡Gracias por unirte a nosotros!</p>
-                    <p style="color: #6366f1;"><strong>Equipo EventHub</strong></p>
-                </div>
-            </body>
-        </html>
+        Las plantillas viven en templates/emails/<nombre>.txt y .html; el
+        loader con caché de Django compila cada plantilla una sola vez.
         """
+        message = render_to_string(f'emails/{template_name}.txt', context)
+        html_message = render_to_string(f'emails/{template_name}.html', context)
+        return message, html_message
+    
+    @staticmethod
+    def send_welcome_email(user):
+        """Envía email de bienvenida"""
+        subject = '¡Bienvenido a EventHub! 🎉'
+        message, html_message = EmailService.render_email('welcome', {'user': user})
         
-        return EmailService.send_email(
+        EmailService.queue_email(
             subject=subject,
             message=message,
             recipient_list=[user.email],
@@ -97,161 +84,70 @@ class EmailService:
     def send_ticket_confirmation(ticket):
         """Envía confirmación de compra de ticket"""
         event = ticket.ticket_type.event
-        user = ticket.user
+        user = ticket.buyer
         
         subject = f'Confirmación de Ticket - {event.title}'
-        message = f"""
-        Hola {user.first_name or user.username},
+        message, html_message = EmailService.render_email('ticket_confirmation', {
+            'user': user,
+            'event': event,
+            'ticket': ticket,
+        })
         
-        ¡Tu ticket ha sido confirmado!
-        
-        Detalles del Evento:
-        - Evento: {event.title}
-        - Fecha: {event.start_date.strftime('%d/%m/%Y %H:%M')}
-        - Ubicación: {event.venue.name}
-        - Tipo de Ticket: {ticket.ticket_type.name}
-        - Precio: ${ticket.final_price}
-        - Código QR: {ticket.qr_code}
-        
-        Presenta este código en el evento para tu ingreso.
-        
-        ¡Nos vemos en el evento!
-        
-        Equipo EventHub
-        """
-        
-        html_message = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                    <h1 style="color: #6366f1;">¡Ticket Confirmado! 🎫</h1>
-                    <p>Hola <strong>{user.first_name or user.username}</strong>,</p>
-                    <p>¡Tu ticket ha sido confirmado exitosamente!</p>
-                    
-                    <div style="background: #f3f4f6; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                        <h3 style="margin-top: 0; color: #6366f1;">Detalles del Evento</h3>
-                        <p><strong>🎉 Evento:</strong> {event.title}</p>
-                        <p><strong>📅 Fecha:</strong> {event.start_date.strftime('%d de %B, %Y a las %H:%M')}</p>
-                        <p><strong>📍 Ubicación:</strong> {event.venue.name}, {event.venue.address}</p>
-                        <p><strong>🎫 Tipo de Ticket:</strong> {ticket.ticket_type.name}</p>
-                        <p><strong>💰 Precio:</strong> ${ticket.final_price}</p>
-                        <p><strong>🔑 Código QR:</strong> <code style="background: #e5e7eb; padding: 4px 8px; border-radius: 4px;">{ticket.qr_code}</code></p>
-                    </div>
-                    
-                    <div style="background: #dbeafe; border-left: 4px solid #3b82f6; padding: 15px; margin: 20px 0;">
-                        <p style="margin: 0;"><strong>💡 Importante:</strong> Presenta este código en el evento para tu ingreso.</p>
-                    </div>
-                    
-                    <p>¡Nos vemos en el evento!</p>
-                    <p style="color: #6366f1;"><strong>Equipo EventHub</strong></p>
-                </div>
-            </body>
-        </html>
-        """
-        
-        return EmailService.send_email(
+        EmailService.queue_email(
             subject=subject,
             message=message,
             recipient_list=[user.email],
             html_message=html_message
         )
     
+    @staticmethod
+    def send_to_attendees(subject, template_name, event, attendees):
+        """
+        Envía el mismo email personalizado a varios asistentes
+        
+        Todos los mensajes salen por una única conexión SMTP en lugar de
+        abrir y cerrar una por destinatario. Si se recibe un queryset, el
+        usuario de cada asistente se carga en el mismo JOIN (sin N+1) y solo
+        con las columnas que usan las plantillas.
+        """
+        if isinstance(attendees, QuerySet):
+            attendees = attendees.select_related('user').only(
+                'user__email', 'user__first_name', 'user__username'
+            )
+        
+        try:
+            with get_connection() as connection:
+                messages = []
+                for attendee in attendees:
+                    message, html_message = EmailService.render_email(template_name, {
+                        'user': attendee.user,
+                        'event': event,
+                    })
+                    email = EmailMultiAlternatives(
+                        subject=subject,
+                        body=message,
+                        from_email=settings.DEFAULT_FROM_EMAIL,
+                        to=[attendee.user.email],
+                        connection=connection
+                    )
+                    email.attach_alternative(html_message, 'text/html')
+                    messages.append(email)
+                
+                sent = connection.send_messages(messages) or 0
+            logger.info("%s emails '%s' enviados para %s", sent, template_name, event.title)
+            return sent
+        except Exception as e:
+            logger.error("Error enviando emails '%s': %s", template_name, e)
+            return 0
+    
     @staticmethod
     def send_event_reminder(event, attendees):
         """Envía recordatorio de evento próximo"""
         subject = f'Recordatorio: {event.title} es mañana!'
-        
-        for attendee in attendees:
-            message = f"""
-            Hola {attendee.user.first_name or attendee.user.username},
-            
-            ¡Tu evento es mañana!
-            
-            Evento: {event.title}
-            Fecha: {event.start_date.strftime('%d/%m/%Y %H:%M')}
-            Ubicación: {event.venue.name}
-            Dirección: {event.venue.address}
-            
-            No olvides llegar 15 minutos antes.
-            
-            ¡Te esperamos!
-            
-            Equipo EventHub
-            """
-            
-            html_message = f"""
-            <html>
-                <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                    <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                        <h1 style="color: #ec4899;">¡Tu evento es mañana! ⏰</h1>
-                        <p>Hola <strong>{attendee.user.first_name or attendee.user.username}</strong>,</p>
-                        
-                        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                            <h2 style="margin-top: 0; color: white;">{event.title}</h2>
-                            <p><strong>📅 Fecha:</strong> {event.start_date.strftime('%d de %B, %Y')}</p>
-                            <p><strong>🕐 Hora:</strong> {event.start_date.strftime('%H:%M')}</p>
-                            <p><strong>📍 Ubicación:</strong> {event.venue.name}</p>
-                            <p><strong>🗺️ Dirección:</strong> {event.venue.address}</p>
-                        </div>
-                        
-                        <div style="background: #fef3c7; border-left: 4px solid #f59e0b; padding: 15px; margin: 20px 0;">
-                            <p style="margin: 0;"><strong>💡 Recuerda:</strong> Llegar 15 minutos antes para el check-in.</p>
-                        </div>
-                        
-                        <p>¡Te esperamos!</p>
-                        <p style="color: #ec4899;"><strong>Equipo EventHub</strong></p>
-                    </div>
-                </body>
-            </html>
-            """
-            
-            EmailService.send_email(
-                subject=subject,
-                message=message,
-                recipient_list=[attendee.user.email],
-                html_message=html_message
-            )
+        return EmailService.send_to_attendees(subject, 'event_reminder', event, attendees)
     
     @staticmethod
     def send_event_cancellation(event, attendees):
         """Envía notificación de evento cancelado"""
         subject = f'Evento Cancelado: {event.title}'
-        
-        for attendee in attendees:
-            message = f"""
-            Hola {attendee.user.first_name or attendee.user.username},
-            
-            Lamentablemente, el evento {event.title} ha sido cancelado.
-            
-            Se procesará el reembolso completo en los próximos 5-7 días hábiles.
-            
-            Disculpa las molestias.
-            
-            Equipo EventHub
-            """
-            
-            html_message = f"""
-            <html>
-                <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                    <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                        <h1 style="color: #ef4444;">Evento Cancelado</h1>
-                        <p>Hola <strong>{attendee.user.first_name or attendee.user.username}</strong>,</p>
-                        <p>Lamentablemente, el evento <strong>{event.title}</strong> ha sido cancelado.</p>
-                        
-                        <div style="background: #fee2e2; border-left: 4px solid #ef4444; padding: 15px; margin: 20px 0;">
-                            <p style="margin: 0;"><strong>💰 Reembolso:</strong> Se procesará el reembolso completo en los próximos 5-7 días hábiles.</p>
-                        </div>
-                        
-                        <p>Disculpa las molestias.</p>
-                        <p style="color: #6366f1;"><strong>Equipo EventHub</strong></p>
-                    </div>
-                </body>
-            </html>
-            """
-            
-            EmailService.send_email(
-                subject=subject,
-                message=message,
-                recipient_list=[attendee.user.email],
-                html_message=html_message
-            )
\ No newline at end of file
+        return EmailService.send_to_attendees(subject, 'event_cancellation', event, attendees)
\ No newline at end of file
@@ -1,11 +1,26 @@
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.db import connection
 from django.conf import settings
+import functools
 import logging
+import os
+
+import orjson
 
 logger = logging.getLogger('apps')
 
 
+@functools.lru_cache(maxsize=1)
+def _file_system_status():
+    """
+    Existencia de MEDIA_ROOT y STATIC_ROOT (se calcula una vez por proceso
+    para no hacer dos stat() en cada sondeo)
+    """
+    media_exists = os.path.exists(settings.MEDIA_ROOT)
+    static_exists = os.path.exists(settings.STATIC_ROOT) or settings.DEBUG
+    return media_exists, static_exists
+
+
 def health_check(request):
     """
     Endpoint de health check para verificar el estado del servidor
@@ -29,16 +44,19 @@ def health_check(request):
         'checks': {}
     }
     
-    # Verificar conexión a la base de datos
+    # Verificar conexión a la base de datos sin ejecutar consultas: se
+    # reutiliza la conexión abierta y solo se reconecta si el ping falla
     try:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
-            health_status['checks']['database'] = {
-                'status': 'healthy',
-                'message': 'Database connection successful'
-            }
+        connection.ensure_connection()
+        if not connection.is_usable():
+            connection.close()
+            connection.ensure_connection()
+        health_status['checks']['database'] = {
+            'status': 'healthy',
+            'message': 'Database connection successful'
+        }
     except Exception as e:
-        logger.error(f"Database health check failed: {e}")
+        logger.error("Database health check failed: %s", e)
         health_status['status'] = 'unhealthy'
         health_status['checks']['database'] = {
             'status': 'unhealthy',
@@ -54,9 +72,7 @@ def health_check(request):
     
     # Verificar archivos estáticos y media
     try:
-        import os
-        media_exists = os.path.exists(settings.MEDIA_ROOT)
-        static_exists = os.path.exists(settings.STATIC_ROOT) or settings.DEBUG
+        media_exists, static_exists = _file_system_status()
         
         health_status['checks']['file_system'] = {
             'status': 'healthy' if media_exists and static_exists else 'warning',
@@ -72,4 +88,9 @@ def health_check(request):
     # Determinar código de estado HTTP
     status_code = 200 if health_status['status'] == 'healthy' else 503
     
-    return JsonResponse(health_status, status=status_code)
\ No newline at end of file
+    # orjson serializa directamente a bytes (el endpoint se consulta a menudo)
+    return HttpResponse(
+        orjson.dumps(health_status, default=str),
+        status=status_code,
+        content_type='application/json'
+    )
\ No newline at end of file